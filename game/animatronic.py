@@ -1,38 +1,99 @@
-from dataclasses import dataclass
-from typing import List
+from typing import Tuple
 from .enums import AnimatronicType, Location
+from .location_graph import LOCATIONS, LOCATION_INDEX
+from .telemetry import telemetry, WATCH_START, WATCH_STOP
 
-@dataclass
 class Animatronic:
-    name: AnimatronicType
-    current_location: Location
-    target_location: Location
-    movement_speed: float
-    aggression: float
-    jumscare_chance: float
-    is_active: bool = True
-    last_move_time: float = 0
-    move_cooldown: float = 0
-    is_being_watched: bool = False
-    watching_timer: float = 0
-    last_seen_location: Location = None
-    
-    def __post_init__(self):
-        self.locations = list(Location)
-        self.locations.remove(Location.OFFICE)  # Animatronics can't be in office unless jumpscaring
-        self.last_seen_location = self.current_location
-    
+    """One animatronic's state, kept compact for simulators that clone it often.
+
+    Locations are stored as location graph indices; `current_location`,
+    `target_location` and `last_seen_location` expose them as `Location` members.
+    """
+
+    __slots__ = (
+        'name', 'location_index', 'target_index', 'movement_speed', 'aggression',
+        'jumscare_chance', 'is_active', 'last_move_time', 'move_cooldown',
+        'is_being_watched', 'watching_timer', 'last_seen_index',
+    )
+
+    def __init__(self, name: AnimatronicType, current_location: Location, target_location: Location,
+                 movement_speed: float, aggression: float, jumscare_chance: float,
+                 is_active: bool = True, last_move_time: float = 0, move_cooldown: float = 0,
+                 is_being_watched: bool = False, watching_timer: float = 0):
+        self.name = name
+        self.location_index = LOCATION_INDEX[current_location]
+        self.target_index = LOCATION_INDEX[target_location]
+        self.movement_speed = movement_speed
+        self.aggression = aggression
+        self.jumscare_chance = jumscare_chance
+        self.is_active = is_active
+        self.last_move_time = last_move_time
+        self.move_cooldown = move_cooldown
+        self.is_being_watched = is_being_watched
+        self.watching_timer = watching_timer
+        self.last_seen_index = self.location_index  # Seen where it starts
+
+    @property
+    def current_location(self) -> Location:
+        return LOCATIONS[self.location_index]
+
+    @current_location.setter
+    def current_location(self, location: Location):
+        self.location_index = LOCATION_INDEX[location]
+
+    @property
+    def target_location(self) -> Location:
+        return LOCATIONS[self.target_index]
+
+    @target_location.setter
+    def target_location(self, location: Location):
+        self.target_index = LOCATION_INDEX[location]
+
+    @property
+    def last_seen_location(self) -> Location:
+        return LOCATIONS[self.last_seen_index]
+
+    @last_seen_location.setter
+    def last_seen_location(self, location: Location):
+        self.last_seen_index = LOCATION_INDEX[location]
+
+    def snapshot(self) -> Tuple:
+        """Get the full state as a flat tuple, in `__slots__` order."""
+        return (self.name, self.location_index, self.target_index, self.movement_speed,
+                self.aggression, self.jumscare_chance, self.is_active, self.last_move_time,
+                self.move_cooldown, self.is_being_watched, self.watching_timer, self.last_seen_index)
+
+    def restore(self, snapshot: Tuple):
+        """Put back a state taken with `snapshot`."""
+        (self.name, self.location_index, self.target_index, self.movement_speed,
+         self.aggression, self.jumscare_chance, self.is_active, self.last_move_time,
+         self.move_cooldown, self.is_being_watched, self.watching_timer, self.last_seen_index) = snapshot
+
+    def copy(self) -> 'Animatronic':
+        """Get an independent copy without running `__init__`."""
+        clone = Animatronic.__new__(Animatronic)
+        clone.restore(self.snapshot())
+        return clone
+
+    def __repr__(self):
+        return (f"Animatronic(name={self.name}, current_location={self.current_location}, "
+                f"is_active={self.is_active}, is_being_watched={self.is_being_watched})")
+
     def update_watching_status(self, is_watched: bool, current_time: float):
         """Update whether the animatronic is being watched."""
         if is_watched:
+            if telemetry.enabled and not self.is_being_watched:
+                telemetry.emit(WATCH_START, self.name, self.current_location)
             self.is_being_watched = True
             self.watching_timer = current_time
-            self.last_seen_location = self.current_location
+            self.last_seen_index = self.location_index
         else:
             # Check if enough time has passed since being watched
             if current_time - self.watching_timer > 3.0:  # 3 seconds after being watched
+                if telemetry.enabled and self.is_being_watched:
+                    telemetry.emit(WATCH_STOP, self.name, self.current_location)
                 self.is_being_watched = False
-    
+
     def can_move(self, current_time: float) -> bool:
         """Check if the animatronic can move (not being watched)."""
-        return not self.is_being_watched and current_time - self.last_move_time >= self.move_cooldown 
\ No newline at end of file
+        return not self.is_being_watched and current_time - self.last_move_time >= self.move_cooldown
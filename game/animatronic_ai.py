@@ -1,128 +1,268 @@
-import random
-import time
-from typing import List, Optional
-from .enums import AnimatronicType, Location, CameraView
+import heapq
+import math
+from typing import List, Optional, Tuple
+from .enums import AnimatronicType, Location
 from .animatronic import Animatronic
-from .constants import WATCHING_STOP_DURATION, WATCHING_DISTANCE
+from .constants import SIMULATION_STEP, WATCHING_STOP_DURATION
+from .rng import GameRNG
+from .location_graph import MOVEMENT_PATHS, NEARBY_LOCATIONS, PATH_POSITIONS, is_watched_from
+from . import telemetry as events
+from .telemetry import telemetry
+
+# Movement schedule entry kinds
+WAKE = 0  # Re-check watching status and cooldown
+MOVE = 1  # Frame of the next successful movement roll
+NO_ENTRY = -1  # Saved schedules: nothing pending (inactive, or frozen in view)
 
 class AnimatronicAI:
-    def __init__(self):
-        # Movement paths for each animatronic (structured progression)
-        self.movement_paths = {
-            AnimatronicType.FREDDY: [
-                Location.STAGE,
-                Location.DINING_AREA,
-                Location.STORAGE_ROOM,
-                Location.HALLWAY_LEFT,
-                Location.VENT_LEFT,
-                Location.OFFICE
-            ],
-            AnimatronicType.BONNIE: [
-                Location.STAGE,
-                Location.DINING_AREA,
-                Location.KITCHEN,
-                Location.HALLWAY_RIGHT,
-                Location.OFFICE
-            ],
-            AnimatronicType.CHICA: [
-                Location.STAGE,
-                Location.DINING_AREA,
-                Location.KITCHEN,
-                Location.HALLWAY_RIGHT,
-                Location.OFFICE
-            ],
-            AnimatronicType.FOXY: [
-                Location.BACKSTAGE,
-                Location.SUPPLY_CLOSET,
-                Location.STORAGE_ROOM,
-                Location.HALLWAY_LEFT,
-                Location.OFFICE
-            ],
-            AnimatronicType.GOLDEN_FREDDY: [
-                Location.SUPPLY_CLOSET,
-                Location.BATHROOM,
-                Location.STORAGE_ROOM,
-                Location.VENT_RIGHT,
-                Location.OFFICE
-            ]
-        }
+    def __init__(self, rng: Optional[GameRNG] = None, tick: float = SIMULATION_STEP, scheduled: bool = True):
+        self.rng = rng or GameRNG()
+        self.tick = tick
+        self.scheduled = scheduled  # False: roll every animatronic every frame (see update_every_frame)
+        self.reschedule()
+        
+        # Movement paths for each animatronic (structured progression) and their
+        # position tables, compiled by the location graph
+        self.movement_paths = MOVEMENT_PATHS
+        self.path_positions = PATH_POSITIONS
     
     def update_animatronics(self, animatronics: List[Animatronic], current_time: float, 
                           current_night: int, left_door_closed: bool, right_door_closed: bool,
                           camera_view) -> Optional[str]:
-        """Update all animatronics with much slower movement and night-based scaling."""
+        """Update all animatronics with much slower movement and night-based scaling.
         
-        # Much slower base movement - significantly reduced for first night
-        base_movement_chance = 0.02  # 2% chance per update (was much higher)
+        Called once per frame. Instead of checking every animatronic and rolling
+        for each eligible one every frame, each animatronic sits in a heap keyed
+        by the time its state can next change: its cooldown ending, its watch
+        delay running out, or the frame of its next successful movement roll,
+        sampled from the geometric distribution. A frame with nothing due only
+        looks at the top of the heap.
+        """
+        if not self.scheduled:
+            return self.update_every_frame(animatronics, current_time, current_night,
+                                           left_door_closed, right_door_closed, camera_view)
+        if (animatronics is not self.scheduled_animatronics or current_night != self.scheduled_night
+                or len(animatronics) != len(self.schedule_versions)):
+            self.build_schedule(animatronics, current_night, camera_view)
+        elif camera_view != self.scheduled_view:
+            self.switch_view(animatronics, camera_view)
         
-        # Night-based scaling - starts very slow, increases gradually
-        night_multiplier = 1.0 + (current_night - 1) * 0.3  # 30% increase per night
+        due = []
+        while self.schedule and self.schedule[0][0] <= current_time:
+            entry = heapq.heappop(self.schedule)
+            if entry[3] == self.schedule_versions[entry[1]]:
+                due.append(entry)
+        due.sort(key=lambda entry: entry[1])  # Same order as the animatronics list
         
-        # Calculate final movement chance
-        movement_chance = base_movement_chance * night_multiplier
+        result = None
+        for position, (_, index, kind, _) in enumerate(due):
+            animatronic = animatronics[index]
+            if kind == MOVE:
+                result = self.move_scheduled(animatronic, index, current_time, left_door_closed, right_door_closed)
+            else:
+                result = self.wake(animatronic, index, current_time, left_door_closed, right_door_closed)
+            if result:
+                # The rest of this frame is skipped, so their turn comes next frame
+                for entry in due[position + 1:]:
+                    heapq.heappush(self.schedule, entry)
+                break
         
-        # Cap maximum speed to prevent it from becoming too fast
-        movement_chance = min(movement_chance, 0.08)  # Max 8% chance even on night 5
+        self.last_update_time = current_time
+        return result
+    
+    def update_every_frame(self, animatronics: List[Animatronic], current_time: float,
+                           current_night: int, left_door_closed: bool, right_door_closed: bool,
+                           camera_view) -> Optional[str]:
+        """Reference update: check every active animatronic and roll for each eligible one.
+        
+        Slower than the schedule, but it consumes gameplay draws in the same
+        order as `BatchNightSimulation`, so fed the same draws both give the
+        same outcome for every game.
+        """
+        movement_chance = self.get_movement_chance(current_night)
         
         for animatronic in animatronics:
             if not animatronic.is_active:
                 continue
             
-            # Check if animatronic is being watched
             is_watched = self.is_animatronic_being_watched(animatronic, camera_view)
             animatronic.update_watching_status(is_watched, current_time)
             
-            # Only move if not being watched and cooldown is ready
-            if animatronic.can_move(current_time) and random.random() < movement_chance:
+            if animatronic.can_move(current_time) and self.rng.gameplay.random() < movement_chance:
                 result = self.move_animatronic_structured(animatronic, left_door_closed, right_door_closed)
                 if result:
                     return result
         
         return None
     
+    def reschedule(self):
+        """Drop the movement schedule so it is rebuilt from the animatronics on the next update.
+        
+        Call this after changing animatronics outside `update_animatronics`.
+        """
+        self.schedule = []  # Heap of (time, index, kind, version)
+        self.schedule_versions = []
+        self.in_view = []
+        self.scheduled_animatronics = None
+        self.scheduled_night = None
+        self.scheduled_view = None
+        self.movement_chance = 0.0
+        self.last_update_time = None
+    
+    def save_schedule(self, animatronics: List[Animatronic]) -> Optional[Tuple]:
+        """Get the pending schedule as (view, last update, (kind, due time, in view) per animatronic).
+        
+        Returns None when no schedule has been built for these animatronics yet.
+        """
+        if animatronics is not self.scheduled_animatronics:
+            return None
+        live = {entry[1]: entry for entry in self.schedule if entry[3] == self.schedule_versions[entry[1]]}
+        entries = []
+        for index in range(len(animatronics)):
+            entry = live.get(index)
+            if entry is None:
+                entries.append((NO_ENTRY, 0.0, self.in_view[index]))
+            else:
+                entries.append((entry[2], entry[0], self.in_view[index]))
+        return self.scheduled_view, self.last_update_time, tuple(entries)
+    
+    def restore_schedule(self, animatronics: List[Animatronic], current_night: int, saved: Optional[Tuple]):
+        """Put back a schedule taken with `save_schedule`, so the night carries on exactly as it would have."""
+        self.reschedule()
+        if saved is None:
+            return
+        camera_view, last_update_time, entries = saved
+        self.build_schedule(animatronics, current_night, camera_view)
+        self.schedule = []
+        for index, (kind, due_time, in_view) in enumerate(entries):
+            self.in_view[index] = in_view
+            if kind != NO_ENTRY:
+                heapq.heappush(self.schedule, (due_time, index, kind, 0))
+        self.last_update_time = last_update_time
+    
+    def build_schedule(self, animatronics: List[Animatronic], current_night: int, camera_view):
+        """Queue every active animatronic for a full check this frame."""
+        self.schedule = []
+        self.schedule_versions = [0] * len(animatronics)
+        self.in_view = [False] * len(animatronics)
+        self.scheduled_animatronics = animatronics
+        self.scheduled_night = current_night
+        self.scheduled_view = camera_view
+        self.movement_chance = self.get_movement_chance(current_night)
+        for index, animatronic in enumerate(animatronics):
+            if animatronic.is_active:
+                heapq.heappush(self.schedule, (-math.inf, index, WAKE, 0))
+    
+    def switch_view(self, animatronics: List[Animatronic], camera_view):
+        """Re-check the animatronics entering or leaving the camera's view."""
+        self.scheduled_view = camera_view
+        for index, animatronic in enumerate(animatronics):
+            if not animatronic.is_active:
+                continue
+            in_view = self.is_animatronic_being_watched(animatronic, camera_view)
+            if in_view == self.in_view[index]:
+                continue  # Pending entries stay valid
+            if self.in_view[index] and self.last_update_time is not None:
+                animatronic.watching_timer = self.last_update_time  # Last frame it was seen
+            self.schedule_versions[index] += 1
+            heapq.heappush(self.schedule, (-math.inf, index, WAKE, self.schedule_versions[index]))
+    
+    def sync_watching_timers(self, animatronics: List[Animatronic]):
+        """Set `watching_timer` to the last update for animatronics still in view.
+        
+        The schedule leaves it untouched while an animatronic stays in view.
+        """
+        if animatronics is not self.scheduled_animatronics or self.last_update_time is None:
+            return
+        for index, animatronic in enumerate(animatronics):
+            if self.in_view[index]:
+                animatronic.watching_timer = self.last_update_time
+    
+    def push_entry(self, index: int, kind: int, due_time: float, current_time: float):
+        """Replace the animatronic's schedule entry; anything already due runs next frame."""
+        if due_time <= current_time:
+            due_time = current_time + self.tick / 2
+        self.schedule_versions[index] += 1
+        heapq.heappush(self.schedule, (due_time, index, kind, self.schedule_versions[index]))
+    
+    def wake(self, animatronic: Animatronic, index: int, current_time: float,
+             left_door_closed: bool, right_door_closed: bool) -> Optional[str]:
+        """Run one frame of watching and movement checks, then schedule the next change."""
+        is_watched = self.is_animatronic_being_watched(animatronic, self.scheduled_view)
+        self.in_view[index] = is_watched
+        animatronic.update_watching_status(is_watched, current_time)
+        
+        if is_watched:
+            self.schedule_versions[index] += 1  # Frozen until the camera moves away
+            return None
+        if animatronic.is_being_watched:
+            self.push_entry(index, WAKE, animatronic.watching_timer + WATCHING_STOP_DURATION, current_time)
+            return None
+        if not animatronic.can_move(current_time):
+            self.push_entry(index, WAKE, animatronic.last_move_time + animatronic.move_cooldown, current_time)
+            return None
+        
+        # Eligible from this frame on: this frame's roll is the first one
+        failed_rolls = self.sample_failed_rolls(self.movement_chance)
+        if failed_rolls:
+            self.push_entry(index, MOVE, current_time + (failed_rolls - 0.5) * self.tick, current_time)
+            return None
+        return self.move_scheduled(animatronic, index, current_time, left_door_closed, right_door_closed)
+    
+    def move_scheduled(self, animatronic: Animatronic, index: int, current_time: float,
+                       left_door_closed: bool, right_door_closed: bool) -> Optional[str]:
+        """Make the move a successful roll asked for and re-check next frame."""
+        result = self.move_animatronic_structured(animatronic, left_door_closed, right_door_closed)
+        self.push_entry(index, WAKE, current_time, current_time)
+        return result
+    
+    def sample_failed_rolls(self, movement_chance: float) -> int:
+        """Sample how many movement rolls fail before the next one succeeds."""
+        if movement_chance >= 1.0:
+            return 0
+        return math.floor(math.log(1.0 - self.rng.gameplay.random()) / math.log(1.0 - movement_chance))
+    
+    def get_movement_chance(self, current_night: int) -> float:
+        """Get the per-update chance that an eligible animatronic moves."""
+        # Much slower base movement - significantly reduced for first night
+        base_movement_chance = 0.02  # 2% chance per update (was much higher)
+        
+        # Night-based scaling - starts very slow, increases gradually
+        night_multiplier = 1.0 + (current_night - 1) * 0.3  # 30% increase per night
+        
+        # Calculate final movement chance
+        movement_chance = base_movement_chance * night_multiplier
+        
+        # Cap maximum speed to prevent it from becoming too fast
+        return min(movement_chance, 0.08)  # Max 8% chance even on night 5
+    
     def get_movement_cooldown(self, location: Location) -> float:
         """Get movement cooldown based on location (much longer cooldowns)."""
+        low, high = self.get_movement_cooldown_range(location)
+        return self.rng.gameplay.uniform(low, high)
+    
+    def get_movement_cooldown_range(self, location: Location) -> Tuple[float, float]:
+        """Get the (min, max) movement cooldown in seconds for a location."""
         # Much longer cooldowns for slower movement
         if location in [Location.STAGE, Location.BACKSTAGE, Location.SUPPLY_CLOSET]:
-            return random.uniform(15.0, 25.0)  # 15-25 seconds in starting areas
+            return 15.0, 25.0  # 15-25 seconds in starting areas
         elif location in [Location.DINING_AREA, Location.KITCHEN, Location.BATHROOM, Location.STORAGE_ROOM]:
-            return random.uniform(12.0, 20.0)  # 12-20 seconds in intermediate areas
+            return 12.0, 20.0  # 12-20 seconds in intermediate areas
         elif location in [Location.HALLWAY_LEFT, Location.HALLWAY_RIGHT]:
-            return random.uniform(8.0, 15.0)  # 8-15 seconds in approach areas
+            return 8.0, 15.0  # 8-15 seconds in approach areas
         elif location in [Location.VENT_LEFT, Location.VENT_RIGHT]:
-            return random.uniform(5.0, 10.0)  # 5-10 seconds in vents
+            return 5.0, 10.0  # 5-10 seconds in vents
         else:
-            return random.uniform(10.0, 18.0)  # Default cooldown
+            return 10.0, 18.0  # Default cooldown
     
     def is_animatronic_being_watched(self, animatronic: Animatronic, camera_view) -> bool:
         """Check if animatronic is being watched in current camera view."""
-        if camera_view == CameraView.OFFICE:
-            return False
-        
-        # Check if animatronic is in current camera view
-        if animatronic.current_location.value == camera_view.value:
-            return True
-        
-        # Check nearby locations (adjacent rooms)
-        nearby_locations = self.get_nearby_locations(camera_view)
-        return animatronic.current_location in nearby_locations
+        # The camera's room and its adjacent rooms, as one bitmask test
+        return is_watched_from(camera_view, animatronic.location_index)
     
     def get_nearby_locations(self, camera_view):
         """Get locations that are adjacent to the current camera view."""
-        nearby_map = {
-            CameraView.STAGE: [Location.BACKSTAGE, Location.DINING_AREA],
-            CameraView.BACKSTAGE: [Location.STAGE, Location.SUPPLY_CLOSET],
-            CameraView.SUPPLY_CLOSET: [Location.BACKSTAGE, Location.BATHROOM],
-            CameraView.DINING_AREA: [Location.STAGE, Location.KITCHEN, Location.STORAGE_ROOM],
-            CameraView.KITCHEN: [Location.DINING_AREA, Location.HALLWAY_RIGHT],
-            CameraView.BATHROOM: [Location.SUPPLY_CLOSET, Location.STORAGE_ROOM],
-            CameraView.STORAGE_ROOM: [Location.DINING_AREA, Location.BATHROOM, Location.HALLWAY_LEFT, Location.HALLWAY_RIGHT],
-            CameraView.HALLWAY_LEFT: [Location.STORAGE_ROOM, Location.VENT_LEFT, Location.OFFICE],
-            CameraView.HALLWAY_RIGHT: [Location.STORAGE_ROOM, Location.KITCHEN, Location.OFFICE],
-            CameraView.VENT_LEFT: [Location.HALLWAY_LEFT, Location.OFFICE],
-            CameraView.VENT_RIGHT: [Location.OFFICE],
-        }
-        return nearby_map.get(camera_view, [])
+        return NEARBY_LOCATIONS.get(camera_view, [])
     
     def move_animatronic_structured(self, animatronic: Animatronic, left_door_closed: bool, 
                                   right_door_closed: bool) -> Optional[str]:
@@ -131,14 +271,12 @@ class AnimatronicAI:
         if not path:
             return None
         
-        current_index = -1
-        for i, location in enumerate(path):
-            if location == animatronic.current_location:
-                current_index = i
-                break
+        current_index = self.get_path_index(animatronic)
         
         if current_index == -1:
             # Animatronic not in their path, reset to start
+            if telemetry.enabled:
+                telemetry.emit(events.MOVE, animatronic.name, animatronic.current_location, path[0])
             animatronic.current_location = path[0]
             return None
         
@@ -152,6 +290,8 @@ class AnimatronicAI:
                 return self.handle_blocked_movement(animatronic, path, current_index, left_door_closed, right_door_closed)
             
             # Move to next location
+            if telemetry.enabled:
+                telemetry.emit(events.MOVE, animatronic.name, path[current_index], next_location)
             animatronic.current_location = next_location
             animatronic.move_cooldown = self.get_movement_cooldown(next_location)
             
@@ -187,17 +327,18 @@ class AnimatronicAI:
             # Return to starting location
             animatronic.current_location = path[0]
         
+        if telemetry.enabled:
+            telemetry.emit(events.BLOCKED, animatronic.name, path[current_index + 1], animatronic.current_location)
         animatronic.move_cooldown = self.get_movement_cooldown(animatronic.current_location)
         return None
     
     def get_animatronic_danger_level(self, animatronic: Animatronic) -> int:
         """Get animatronic's danger level based on their position in the path."""
-        path = self.movement_paths.get(animatronic.name, [])
-        if not path:
-            return 0
-        
-        try:
-            current_index = path.index(animatronic.current_location)
-            return current_index
-        except ValueError:
-            return 0 
\ No newline at end of file
+        return max(self.get_path_index(animatronic), 0)
+    
+    def get_path_index(self, animatronic: Animatronic) -> int:
+        """Get the animatronic's position on its path, or -1 if it is off the path."""
+        table = self.path_positions.get(animatronic.name)
+        if table is None:
+            return -1
+        return table[animatronic.location_index] 
\ No newline at end of file
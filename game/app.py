@@ -0,0 +1,949 @@
+import pygame
+import os
+import sqlite3
+import time
+
+from .constants import *
+from .enums import *
+from .clock import VirtualClock
+from .rng import GameRNG
+from .simulation import NightSimulation
+from .camera_system import CameraSystem
+from .ui_system import UISystem
+from .office_renderer import OfficeRenderer
+from .post_processing import PostProcessor
+from .profiler import FrameProfiler
+from .dirty_regions import DirtyRegionTracker
+from .fonts import get_font, clear_fonts
+from .text_cache import render_text, text_cache
+from .sprites import animatronic_sprites
+from .location_graph import CAMERA_VIEWS, CAMERA_VIEW_INDEX, get_screen_position, is_shown_on_camera
+from .stats_store import StatsStore
+from .night_history import NightHistory
+from .telemetry import telemetry
+from .tracing import tracer, DEFAULT_SPAN_BUDGET
+from .replay import Replay, ReplayPlayer, get_controls, restore_start
+from . import replay as replay_actions
+
+
+class FNAFGame:
+    def __init__(self, rng=None, clock=None, stats_store=None, night_history=None):
+        pygame.init()
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption("Five Nights at Freddy's Enhanced")
+        self.clock = pygame.time.Clock()
+        
+        # Game state
+        self.game_state = GameState.MENU
+        
+        # Shared randomness and game-time clock (inject seeded ones for reproducible runs)
+        self.rng = rng or GameRNG()
+        self.game_clock = clock or VirtualClock()
+        
+        # Screen areas to present this frame, reported by the systems that change them
+        self.dirty_regions = DirtyRegionTracker(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.drawn_state = None
+        self.drawn_animatronics = None
+        self.drawn_effects = False
+        
+        # Game systems
+        self.simulation = NightSimulation(rng=self.rng, clock=self.game_clock)
+        self.camera_system = CameraSystem(self.rng, self.dirty_regions)
+        self.animatronic_ai = self.simulation.animatronic_ai
+        self.ui_system = UISystem(self.dirty_regions)
+        self.office_renderer = OfficeRenderer()
+        self.post_processor = PostProcessor(self.screen, self.camera_system.overlays)
+        
+        # Per-phase frame timings; F3 toggles the overlay, FNAF_PROFILE_CSV dumps them at exit
+        self.profiler = FrameProfiler(dirty_regions=self.dirty_regions)
+        self.simulation.profiler = self.profiler
+        self.profile_csv = os.environ.get('FNAF_PROFILE_CSV')
+        
+        # Night replays: inputs of the current night, saved to FNAF_REPLAY_DIR when it ends
+        self.replay = None
+        self.last_replay = None
+        self.replay_player = None
+        self.replay_dir = os.environ.get('FNAF_REPLAY_DIR')
+        
+        # Gameplay telemetry, appended to the gzipped JSONL file FNAF_TELEMETRY names
+        telemetry_path = os.environ.get('FNAF_TELEMETRY')
+        if telemetry_path:
+            telemetry.start(telemetry_path, clock=self.game_clock)
+        
+        # Chrome trace of every frame, written to FNAF_TRACE at exit (open it in Perfetto)
+        trace_path = os.environ.get('FNAF_TRACE')
+        if trace_path:
+            tracer.start(trace_path, int(os.environ.get('FNAF_TRACE_SPANS', DEFAULT_SPAN_BUDGET)))
+            self.instrument_tracing()
+        
+        # Practice checkpoint: F5 saves the night, F9 goes back to it (also after a game over)
+        self.checkpoint = None
+        
+        # Fixed-timestep state: render rate can drop without changing gameplay speed
+        self.render_fps = FPS
+        self.render_alpha = 0.0
+        self.previous_power = self.simulation.current_power
+        
+        # Game mechanics
+        self.jumpscare_active = False
+        self.jumpscare_timer = 0
+        self.flash_effect = False
+        self.flash_timer = 0
+        self.screen_shake = False
+        self.shake_timer = 0
+        
+        # Statistics
+        self.nights_survived = 0
+        self.total_jumpscares = 0
+        self.best_survival_time = 0
+        self.total_score = 0
+        self.survival_bonus = 0
+        self.pending_result = None  # A lost night that a checkpoint can still take back
+        
+        # Load saved statistics; night results are logged as they happen and kept per night.
+        # Pass a stats store (and its history) to keep the player's files out of tools and tests.
+        if stats_store is None:
+            try:
+                night_history = NightHistory()
+            except sqlite3.Error:
+                night_history = None
+            stats_store = StatsStore(history=night_history)
+        self.night_history = night_history
+        self.stats_store = stats_store
+        self.load_statistics()
+    
+    def instrument_tracing(self):
+        """Record a trace span for every call of the per-frame methods."""
+        tracer.instrument(self, 'handle_events', 'update', 'update_simulation', 'update_visual_effects',
+                          'draw', 'draw_scene', 'draw_office', 'draw_camera_view', 'draw_menu',
+                          'draw_game_over', 'draw_victory', 'draw_paused')
+        tracer.instrument(self.simulation, 'step', 'update_time', 'update_power', 'update_animatronics')
+        tracer.instrument(self.camera_system, 'draw_camera_view', 'draw_small_camera_map',
+                          'switch_to_camera', 'switch_to_office')
+        tracer.instrument(self.ui_system, 'draw_ui')
+        tracer.instrument(self.post_processor, 'begin_frame', 'finish_frame')
+        tracer.instrument(self.dirty_regions, 'present')
+        tracer.instrument(pygame.display, 'flip', 'update')
+    
+    def handle_events(self):
+        """Handle pygame events."""
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+            
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F3:
+                    self.profiler.toggle_overlay()
+                elif event.key == pygame.K_F5 and self.game_state == GameState.PLAYING:
+                    self.save_checkpoint()
+                elif event.key == pygame.K_F9 and self.game_state in (GameState.PLAYING, GameState.GAME_OVER):
+                    self.load_checkpoint()
+                
+                if event.key == pygame.K_ESCAPE:
+                    if self.game_state == GameState.PLAYING:
+                        # During playback the camera follows the replay, so ESC only pauses
+                        if self.camera_system.current_view != CameraView.OFFICE and self.replay_player is None:
+                            self.camera_system.switch_to_office()
+                        else:
+                            self.game_state = GameState.PAUSED
+                    elif self.game_state == GameState.PAUSED:
+                        self.game_state = GameState.PLAYING
+                
+                # Enhanced quick controls
+                if self.game_state == GameState.PLAYING and self.replay_player is None:
+                    if event.key == pygame.K_1:
+                        self.toggle_left_door()
+                    elif event.key == pygame.K_2:
+                        self.toggle_right_door()
+                    elif event.key == pygame.K_3:
+                        self.toggle_left_light()
+                    elif event.key == pygame.K_4:
+                        self.toggle_right_light()
+                    elif event.key == pygame.K_c:
+                        self.game_state = GameState.CAMERA_MAP
+                    elif event.key == pygame.K_v:
+                        self.toggle_vent_system()
+                    elif event.key == pygame.K_e:
+                        self.activate_emergency_power()
+                    elif event.key == pygame.K_TAB:
+                        self.camera_system.cycle_camera_views()
+            
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                if self.game_state == GameState.MENU:
+                    self.handle_menu_click(event.pos)
+                elif self.game_state == GameState.PLAYING:
+                    if self.replay_player is None:
+                        self.handle_game_click(event.pos)
+                elif self.game_state == GameState.GAME_OVER:
+                    self.handle_game_over_click(event.pos)
+                elif self.game_state == GameState.VICTORY:
+                    self.handle_victory_click(event.pos)
+        
+        return True
+    
+    def handle_menu_click(self, pos):
+        """Handle clicks on the enhanced main menu."""
+        # Start game button
+        start_rect = pygame.Rect(SCREEN_WIDTH // 2 - 100, 250, 200, 50)
+        if start_rect.collidepoint(pos):
+            self.start_new_game()
+        
+        # Custom night button
+        custom_rect = pygame.Rect(SCREEN_WIDTH // 2 - 100, 310, 200, 50)
+        if custom_rect.collidepoint(pos):
+            self.simulation.current_night = 3
+            self.start_new_game()
+        
+        # Statistics button
+        stats_rect = pygame.Rect(SCREEN_WIDTH // 2 - 100, 370, 200, 50)
+        if stats_rect.collidepoint(pos):
+            self.draw_statistics()
+        
+        # Quit button
+        quit_rect = pygame.Rect(SCREEN_WIDTH // 2 - 100, 430, 200, 50)
+        if quit_rect.collidepoint(pos):
+            return False
+    
+    def handle_game_click(self, pos):
+        """Handle clicks during gameplay."""
+        button_name = self.ui_system.handle_button_click(pos)
+        if button_name:
+            if button_name == 'left_door':
+                self.toggle_left_door()
+            elif button_name == 'right_door':
+                self.toggle_right_door()
+            elif button_name == 'left_light':
+                self.toggle_left_light()
+            elif button_name == 'right_light':
+                self.toggle_right_light()
+            elif button_name == 'camera':
+                # Switch to camera view instead of camera map
+                if self.camera_system.current_view == CameraView.OFFICE:
+                    self.camera_system.switch_to_camera(CameraView.STAGE)
+                else:
+                    self.camera_system.switch_to_office()
+            elif button_name == 'vent':
+                self.toggle_vent_system()
+            elif button_name == 'emergency_power':
+                self.activate_emergency_power()
+        
+        # Handle clicks on small camera map when in camera view
+        if self.camera_system.current_view != CameraView.OFFICE:
+            result = self.camera_system.handle_small_map_click(pos)
+            if result == "office":
+                self.camera_system.switch_to_office()
+            elif result:
+                self.camera_system.switch_to_camera(result)
+    
+    # Removed handle_camera_map_click method as it's now handled in handle_game_click
+    
+    def handle_game_over_click(self, pos):
+        """Handle clicks on game over screen."""
+        restart_rect = pygame.Rect(SCREEN_WIDTH // 2 - 100, 450, 200, 50)
+        if restart_rect.collidepoint(pos):
+            self.game_state = GameState.MENU
+    
+    def handle_victory_click(self, pos):
+        """Handle clicks on victory screen."""
+        if self.simulation.current_night < 5:
+            # Continue to next night button
+            next_night_rect = pygame.Rect(SCREEN_WIDTH // 2 - 150, 450, 300, 50)
+            if next_night_rect.collidepoint(pos):
+                self.start_next_night()
+                return
+            
+            # Return to menu button
+            menu_rect = pygame.Rect(SCREEN_WIDTH // 2 - 100, 520, 200, 50)
+            if menu_rect.collidepoint(pos):
+                self.game_state = GameState.MENU
+                return
+        else:
+            # Final victory - return to menu
+            restart_rect = pygame.Rect(SCREEN_WIDTH // 2 - 100, 450, 200, 50)
+            if restart_rect.collidepoint(pos):
+                self.game_state = GameState.MENU
+    
+    def toggle_left_door(self):
+        """Toggle left door with enhanced feedback."""
+        self.record_input(replay_actions.LEFT_DOOR)
+        self.dirty_regions.invalidate((100, 100, 200, 500))
+        if self.simulation.toggle_left_door():
+            self.flash_effect = True
+            self.flash_timer = 0.1
+    
+    def toggle_right_door(self):
+        """Toggle right door with enhanced feedback."""
+        self.record_input(replay_actions.RIGHT_DOOR)
+        self.dirty_regions.invalidate((900, 100, 200, 500))
+        if self.simulation.toggle_right_door():
+            self.flash_effect = True
+            self.flash_timer = 0.1
+    
+    def toggle_left_light(self):
+        """Toggle left light with enhanced feedback."""
+        self.record_input(replay_actions.LEFT_LIGHT)
+        self.dirty_regions.invalidate((0, 150, 100, 401))
+        self.simulation.toggle_left_light()
+    
+    def toggle_right_light(self):
+        """Toggle right light with enhanced feedback."""
+        self.record_input(replay_actions.RIGHT_LIGHT)
+        self.dirty_regions.invalidate((1100, 150, 100, 401))
+        self.simulation.toggle_right_light()
+    
+    def toggle_vent_system(self):
+        """Toggle vent system with enhanced feedback."""
+        self.record_input(replay_actions.VENT)
+        if self.simulation.toggle_vent_system():
+            self.flash_effect = True
+            self.flash_timer = 0.2
+    
+    def activate_emergency_power(self):
+        """Activate emergency power system with enhanced effects."""
+        self.record_input(replay_actions.EMERGENCY_POWER)
+        if self.simulation.activate_emergency_power():
+            self.flash_effect = True
+            self.flash_timer = 0.5
+            self.screen_shake = True
+            self.shake_timer = 0.3
+    
+    def start_new_game(self):
+        """Start a new game."""
+        self.game_state = GameState.PLAYING
+        self.replay_player = None
+        self.start_night(self.simulation.current_night)
+    
+    def start_next_night(self):
+        """Start the next night with increased difficulty."""
+        self.replay_player = None
+        self.start_night(self.simulation.current_night + 1)
+    
+    def start_night(self, night, seed=None):
+        """Start a night from its own gameplay seed and begin recording its replay."""
+        self.commit_night_result()
+        if seed is None:
+            seed = self.rng.gameplay.getrandbits(63)
+        self.rng.reseed_gameplay(seed)
+        self.simulation.start_night(night)
+        self.replay = Replay(seed, night, get_controls(self.simulation), self.simulation.snapshot())
+        self.previous_power = self.simulation.current_power
+        self.jumpscare_active = False
+        self.camera_system.switch_to_office()
+    
+    def play_replay(self, replay):
+        """Play a recorded night back in the game window, ignoring player input."""
+        self.start_night(replay.night, replay.seed)
+        restore_start(self.simulation, replay)
+        self.previous_power = self.simulation.current_power
+        self.replay_player = ReplayPlayer(replay)
+        self.game_state = GameState.PLAYING
+    
+    def record_input(self, action, argument=0):
+        """Log a player input against the simulation step it lands before."""
+        if self.replay is not None and self.replay_player is None:
+            self.replay.record(self.simulation.step_count, action, argument)
+    
+    def apply_replay_input(self, action, argument):
+        """Feed one recorded input through the same paths as live input."""
+        if action == replay_actions.LEFT_DOOR:
+            self.toggle_left_door()
+        elif action == replay_actions.RIGHT_DOOR:
+            self.toggle_right_door()
+        elif action == replay_actions.LEFT_LIGHT:
+            self.toggle_left_light()
+        elif action == replay_actions.RIGHT_LIGHT:
+            self.toggle_right_light()
+        elif action == replay_actions.VENT:
+            self.toggle_vent_system()
+        elif action == replay_actions.EMERGENCY_POWER:
+            self.activate_emergency_power()
+        elif action == replay_actions.CAMERA:
+            camera_view = CAMERA_VIEWS[argument]
+            if camera_view == CameraView.OFFICE:
+                self.camera_system.switch_to_office()
+            else:
+                self.camera_system.switch_to_camera(camera_view)
+            self.simulation.camera_view = camera_view
+    
+    def finish_replay(self, outcome):
+        """Close the current night's replay and save it when FNAF_REPLAY_DIR is set."""
+        if self.replay is None:
+            return
+        self.replay.finish(self.simulation.step_count, outcome)
+        self.last_replay = self.replay
+        self.replay = None
+        if self.replay_dir and self.replay_player is None:
+            os.makedirs(self.replay_dir, exist_ok=True)
+            name = f"night{self.last_replay.night}_{self.last_replay.seed:016x}.fnrp"
+            self.last_replay.save(os.path.join(self.replay_dir, name))
+    
+    def save_checkpoint(self):
+        """Remember the current moment of the night to retry from."""
+        if self.replay_player is not None or self.replay is None:
+            return
+        self.checkpoint = (self.simulation.snapshot(), self.replay, len(self.replay.inputs))
+    
+    def load_checkpoint(self):
+        """Go back to the saved checkpoint; the replay keeps only the inputs made before it."""
+        if self.checkpoint is None or self.replay_player is not None:
+            return
+        snapshot, replay, input_count = self.checkpoint
+        if snapshot.night != self.simulation.current_night:
+            return  # Checkpoints don't carry over to another night
+        self.simulation.restore(snapshot)
+        self.pending_result = None  # The retry replaces the lost night
+        self.load_statistics()
+        self.replay = Replay(replay.seed, replay.night, replay.controls, replay.start_state)
+        self.replay.inputs = replay.inputs[:input_count]
+        
+        if snapshot.camera_view == CameraView.OFFICE:
+            self.camera_system.switch_to_office()
+        else:
+            self.camera_system.switch_to_camera(snapshot.camera_view)
+        self.previous_power = self.simulation.current_power
+        self.jumpscare_active = False
+        self.flash_effect = False
+        self.screen_shake = False
+        self.game_state = GameState.PLAYING
+        self.dirty_regions.invalidate_all()
+    
+    def update_simulation(self, dt):
+        """Step the night simulation and react to its outcome."""
+        if self.replay_player is not None:
+            # The simulation's view comes only from the replay's camera inputs
+            self.replay_player.apply_due(self.simulation.step_count, self.apply_replay_input)
+        else:
+            if self.camera_system.current_view != self.simulation.camera_view:
+                self.record_input(replay_actions.CAMERA, CAMERA_VIEW_INDEX[self.camera_system.current_view])
+            self.simulation.camera_view = self.camera_system.current_view
+        outcome = self.simulation.step(dt)
+        if outcome is not None:
+            self.finish_replay(outcome)
+        
+        if (tracer.enabled
+                and self.previous_power > POWER_WARNING_THRESHOLD >= self.simulation.current_power):
+            tracer.instant('power_warning', power=self.simulation.current_power)
+        
+        # Power warning effects
+        if (self.simulation.current_power <= POWER_WARNING_THRESHOLD
+                and not self.simulation.emergency_power):
+            if self.rng.cosmetic.random() < 0.05:  # Reduced frequency
+                self.flash_effect = True
+                self.flash_timer = 0.1
+        
+        if outcome == "victory":
+            self.game_state = GameState.VICTORY
+            self.calculate_survival_bonus()
+        elif outcome == "power_out":
+            self.game_state = GameState.GAME_OVER
+        elif outcome == "jumpscare":
+            self.trigger_jumpscare(self.simulation.jumpscare_animatronic)
+        
+        if outcome is not None:
+            self.record_night_result(outcome)
+            if tracer.enabled:
+                tracer.instant('night_end', outcome=outcome, night=self.simulation.current_night)
+    
+    def trigger_jumpscare(self, animatronic):
+        """Trigger a jumpscare with enhanced effects."""
+        if tracer.enabled:
+            tracer.instant('jumpscare', animatronic=animatronic.name.value)
+        self.jumpscare_active = True
+        self.jumpscare_timer = 3.0
+        self.flash_effect = True
+        self.flash_timer = 0.5
+        self.screen_shake = True
+        self.shake_timer = 1.0
+        if self.replay_player is None:
+            self.total_jumpscares += 1
+        self.game_state = GameState.GAME_OVER
+    
+    def update_visual_effects(self, dt):
+        """Update visual effects like flashing and screen shake."""
+        if self.flash_effect:
+            self.flash_timer -= dt
+            if self.flash_timer <= 0:
+                self.flash_effect = False
+        
+        if self.screen_shake:
+            self.shake_timer -= dt
+            if self.shake_timer <= 0:
+                self.screen_shake = False
+        
+        # Update camera static
+        self.camera_system.update_static(dt)
+    
+    def calculate_survival_bonus(self):
+        """Calculate enhanced survival bonus and update statistics."""
+        power_bonus = int(self.simulation.current_power * 10)
+        time_bonus = int((6 - self.simulation.current_hour) * 100)
+        self.survival_bonus = power_bonus + time_bonus + (self.simulation.current_night * 100)
+        
+        # Update statistics; watching a replay doesn't count
+        if self.replay_player is not None:
+            return
+        self.nights_survived += 1
+        self.total_score += self.survival_bonus
+        
+        # Update best survival time
+        survival_time = self.get_survival_time()
+        if survival_time > self.best_survival_time:
+            self.best_survival_time = survival_time
+    
+    def get_survival_time(self):
+        """Get the survival time of the current night in minutes, as the statistics count it."""
+        return (self.simulation.current_hour - 12) * 60 + self.simulation.current_minute
+    
+    def record_night_result(self, outcome):
+        """Hand a finished night to the statistics log.
+        
+        Replays aren't recorded, and a lost night that a checkpoint could still
+        retry is held back until the player moves on, so only its final result counts.
+        """
+        if self.replay_player is not None:
+            return
+        jumpscare_animatronic = self.simulation.jumpscare_animatronic
+        replay = self.last_replay
+        result = {
+            'timestamp': time.time(),
+            'night': self.simulation.current_night,
+            'outcome': outcome,
+            'score': self.survival_bonus if outcome == "victory" else 0,
+            'survival_time': self.get_survival_time(),
+            'seconds': round(self.simulation.current_time, 3),
+            'power': round(self.simulation.current_power, 2),
+            'cause': jumpscare_animatronic.name.value if outcome == "jumpscare" else None,
+            'controls': replay.count_inputs() if replay is not None else {},
+        }
+        if (outcome != "victory" and self.checkpoint is not None
+                and self.checkpoint[0].night == self.simulation.current_night):
+            self.pending_result = result
+        else:
+            self.stats_store.record(result)
+    
+    def commit_night_result(self):
+        """Record a held-back night result once it can no longer be retried."""
+        if self.pending_result is not None:
+            self.stats_store.record(self.pending_result)
+            self.pending_result = None
+    
+    def draw_scene(self, paused=False):
+        """Draw the office or camera feed, then apply the full-frame effects."""
+        if self.camera_system.current_view == CameraView.OFFICE:
+            # Apply screen shake
+            shake_offset = 0
+            if self.screen_shake:
+                shake_offset = self.rng.cosmetic.randint(-5, 5)
+            
+            with self.profiler.phase('draw_office'):
+                self.draw_office(self.post_processor.begin_frame(shake_offset))
+            self.post_processor.finish_frame(flash=self.flash_effect, dim=paused)
+        else:
+            self.post_processor.begin_frame()
+            with self.profiler.phase('draw_camera_view'):
+                if paused:
+                    self.draw_camera_view()
+                    static_dots = 150
+                else:
+                    self.camera_system.draw_camera_view(self.screen, self.simulation.animatronics)
+                    static_dots = 100
+            
+            if not self.camera_system.camera_static:
+                static_dots = 0
+            self.post_processor.finish_frame(dim=paused, static_dots=static_dots)
+    
+    def draw_office(self, surface):
+        """Draw the office with enhanced visual effects."""
+        # Pre-built background for the current door and light state
+        background = self.office_renderer.get_layer(
+            self.simulation.left_door_closed, self.simulation.right_door_closed,
+            self.simulation.left_light_on, self.simulation.right_light_on)
+        surface.blit(background, (0, 0))
+        
+        # Animatronics in office
+        for animatronic in self.simulation.animatronics:
+            if animatronic.current_location == Location.OFFICE:
+                self.draw_animatronic(surface, animatronic)
+    
+    def draw_camera_view(self):
+        """Draw the enhanced camera view."""
+        self.screen.fill(BLACK)
+        
+        # Camera view background with scan lines effect
+        camera_rect = pygame.Rect(50, 50, SCREEN_WIDTH - 100, SCREEN_HEIGHT - 200)
+        pygame.draw.rect(self.screen, DARK_GRAY, camera_rect)
+        
+        # Scan lines effect
+        self.camera_system.overlays.draw_scanlines(self.screen, pygame.Rect(50, 50, SCREEN_WIDTH - 99, SCREEN_HEIGHT - 200))
+        
+        # Show animatronics in current camera view
+        for animatronic in self.simulation.animatronics:
+            if is_shown_on_camera(self.camera_system.current_view, animatronic.current_location):
+                self.draw_animatronic(self.screen, animatronic)
+        
+        # Enhanced camera label with glow effect
+        font = get_font(36)
+        label = render_text(font, f"Camera: {self.camera_system.current_view.value}", WHITE)
+        label_rect = label.get_rect(center=(SCREEN_WIDTH // 2, 30))
+        
+        # Glow effect
+        glow_surface = render_text(font, f"Camera: {self.camera_system.current_view.value}", (100, 100, 100))
+        glow_rect = glow_surface.get_rect(center=(SCREEN_WIDTH // 2 + 2, 32))
+        self.screen.blit(glow_surface, glow_rect)
+        
+        self.screen.blit(label, label_rect)
+        
+        # Camera status indicator
+        small_font = get_font(24)
+        status_text = render_text(small_font, "LIVE", RED)
+        self.screen.blit(status_text, (SCREEN_WIDTH - 100, 20))
+        
+        # Watching indicator
+        watching_animatronics = [a for a in self.simulation.animatronics if a.is_being_watched]
+        if watching_animatronics:
+            watch_text = render_text(small_font, f"Watching: {len(watching_animatronics)} animatronic(s) stopped", GREEN)
+            self.screen.blit(watch_text, (50, 80))
+    
+    def draw_animatronic(self, surface, animatronic):
+        """Draw an animatronic with enhanced visuals."""
+        # Position based on location, from the location graph
+        view = 'office' if animatronic.current_location == Location.OFFICE else 'hallway'
+        pos = get_screen_position(animatronic.current_location)
+        
+        animatronic_sprites.draw(surface, animatronic.name, view, animatronic.is_being_watched, pos)
+    
+    def draw_menu(self):
+        """Draw the enhanced main menu."""
+        self.screen.fill(BLACK)
+        
+        # Animated background effect
+        for _ in range(50):
+            x = self.rng.cosmetic.randint(0, SCREEN_WIDTH)
+            y = self.rng.cosmetic.randint(0, SCREEN_HEIGHT)
+            pygame.draw.circle(self.screen, DARK_GRAY, (x, y), 2)
+        
+        # Title with glow effect
+        title = render_text(self.ui_system.large_font, "Five Nights at Freddy's Enhanced", RED)
+        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 150))
+        
+        # Glow effect
+        for offset in range(3):
+            glow_surface = render_text(self.ui_system.large_font, "Five Nights at Freddy's Enhanced", (100, 0, 0))
+            glow_rect = glow_surface.get_rect(center=(SCREEN_WIDTH // 2 + offset, 150 + offset))
+            self.screen.blit(glow_surface, glow_rect)
+        
+        self.screen.blit(title, title_rect)
+        
+        # Menu buttons
+        buttons = [
+            ("Start Game", GREEN),
+            ("Custom Night", BLUE),
+            ("Statistics", YELLOW),
+            ("Quit", RED)
+        ]
+        
+        for i, (text, color) in enumerate(buttons):
+            button_rect = pygame.Rect(SCREEN_WIDTH // 2 - 100, 250 + i * 60, 200, 50)
+            pygame.draw.rect(self.screen, color, button_rect)
+            
+            button_text = render_text(self.ui_system.font, text, WHITE)
+            text_rect = button_text.get_rect(center=button_rect.center)
+            self.screen.blit(button_text, text_rect)
+        
+        # Enhanced instructions
+        instructions = [
+            "Controls: 1/2 - Doors | 3/4 - Lights | C - Camera Map | V - Vent | E - Emergency | TAB - Cycle Cameras",
+            "ESC - Return to Office/Pause | Mouse - Click buttons"
+        ]
+        
+        for i, instruction in enumerate(instructions):
+            text = render_text(self.ui_system.small_font, instruction, WHITE)
+            self.screen.blit(text, (50, 500 + i * 25))
+    
+    def draw_game_over(self):
+        """Draw the enhanced game over screen."""
+        self.screen.fill(BLACK)
+        
+        # Animated background with red particles
+        for _ in range(50):
+            x = self.rng.cosmetic.randint(0, SCREEN_WIDTH)
+            y = self.rng.cosmetic.randint(0, SCREEN_HEIGHT)
+            pygame.draw.circle(self.screen, (100, 0, 0), (x, y), 2)
+        
+        # Game over text with dramatic effect
+        game_over_text = render_text(self.ui_system.large_font, "GAME OVER", RED)
+        text_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, 200))
+        
+        # Glow effect
+        for offset in range(5):
+            glow_surface = render_text(self.ui_system.large_font, "GAME OVER", (50, 0, 0))
+            glow_rect = glow_surface.get_rect(center=(SCREEN_WIDTH // 2 + offset, 200 + offset))
+            self.screen.blit(glow_surface, glow_rect)
+        
+        self.screen.blit(game_over_text, text_rect)
+        
+        # Time survived
+        time_text = render_text(self.ui_system.font, f"Time survived: {self.simulation.current_hour:02d}:{self.simulation.current_minute:02d}", WHITE)
+        time_rect = time_text.get_rect(center=(SCREEN_WIDTH // 2, 300))
+        self.screen.blit(time_text, time_rect)
+        
+        # Power remaining
+        power_text = render_text(self.ui_system.font, f"Power remaining: {int(self.simulation.current_power)}%", WHITE)
+        power_rect = power_text.get_rect(center=(SCREEN_WIDTH // 2, 350))
+        self.screen.blit(power_text, power_rect)
+        
+        # Return button
+        restart_text = render_text(self.ui_system.font, "Click to return to menu", WHITE)
+        restart_rect = pygame.Rect(SCREEN_WIDTH // 2 - 100, 450, 200, 50)
+        pygame.draw.rect(self.screen, GREEN, restart_rect)
+        restart_text_rect = restart_text.get_rect(center=restart_rect.center)
+        self.screen.blit(restart_text, restart_text_rect)
+    
+    def draw_victory(self):
+        """Draw the enhanced victory screen."""
+        self.screen.fill(BLACK)
+        
+        # Animated background
+        for _ in range(100):
+            x = self.rng.cosmetic.randint(0, SCREEN_WIDTH)
+            y = self.rng.cosmetic.randint(0, SCREEN_HEIGHT)
+            pygame.draw.circle(self.screen, GREEN, (x, y), 3)
+        
+        # Victory text with glow effect
+        victory_text = render_text(self.ui_system.large_font, "VICTORY!", WHITE)
+        text_rect = victory_text.get_rect(center=(SCREEN_WIDTH // 2, 150))
+        
+        # Glow effect
+        for offset in range(5):
+            glow_surface = render_text(self.ui_system.large_font, "VICTORY!", (0, 100, 0))
+            glow_rect = glow_surface.get_rect(center=(SCREEN_WIDTH // 2 + offset, 150 + offset))
+            self.screen.blit(glow_surface, glow_rect)
+        
+        self.screen.blit(victory_text, text_rect)
+        
+        # Survival message
+        survival_text = render_text(self.ui_system.font, "You survived the night!", WHITE)
+        survival_rect = survival_text.get_rect(center=(SCREEN_WIDTH // 2, 220))
+        self.screen.blit(survival_text, survival_rect)
+        
+        # Enhanced bonus display
+        bonus_text = render_text(self.ui_system.font, f"Survival Bonus: {self.survival_bonus} points", GOLD)
+        bonus_rect = bonus_text.get_rect(center=(SCREEN_WIDTH // 2, 300))
+        self.screen.blit(bonus_text, bonus_rect)
+        
+        # Time survived
+        time_text = render_text(self.ui_system.small_font, f"Time survived: {self.simulation.current_hour:02d}:{self.simulation.current_minute:02d}", WHITE)
+        time_rect = time_text.get_rect(center=(SCREEN_WIDTH // 2, 350))
+        self.screen.blit(time_text, time_rect)
+        
+        # Night progress
+        if self.simulation.current_night < 5:
+            night_text = render_text(self.ui_system.small_font, f"Night {self.simulation.current_night} completed! {5 - self.simulation.current_night} nights remaining", WHITE)
+        else:
+            night_text = render_text(self.ui_system.small_font, "All 5 nights completed! You've survived!", GOLD)
+        night_rect = night_text.get_rect(center=(SCREEN_WIDTH // 2, 380))
+        self.screen.blit(night_text, night_rect)
+        
+        # Action buttons
+        if self.simulation.current_night < 5:
+            # Continue to next night button
+            next_night_text = render_text(self.ui_system.font, "Continue to Night " + str(self.simulation.current_night + 1), WHITE)
+            next_night_rect = pygame.Rect(SCREEN_WIDTH // 2 - 150, 450, 300, 50)
+            pygame.draw.rect(self.screen, GREEN, next_night_rect)
+            next_night_text_rect = next_night_text.get_rect(center=next_night_rect.center)
+            self.screen.blit(next_night_text, next_night_text_rect)
+            
+            # Return to menu button
+            menu_text = render_text(self.ui_system.font, "Return to Menu", WHITE)
+            menu_rect = pygame.Rect(SCREEN_WIDTH // 2 - 100, 520, 200, 50)
+            pygame.draw.rect(self.screen, BLUE, menu_rect)
+            menu_text_rect = menu_text.get_rect(center=menu_rect.center)
+            self.screen.blit(menu_text, menu_text_rect)
+        else:
+            # Final victory - return to menu
+            restart_text = render_text(self.ui_system.font, "Return to Menu", WHITE)
+            restart_rect = pygame.Rect(SCREEN_WIDTH // 2 - 100, 450, 200, 50)
+            pygame.draw.rect(self.screen, BLUE, restart_rect)
+            restart_text_rect = restart_text.get_rect(center=restart_rect.center)
+            self.screen.blit(restart_text, restart_text_rect)
+    
+    def draw_paused(self):
+        """Draw the paused screen."""
+        # Draw the current game state dimmed in background
+        self.draw_scene(paused=True)
+        
+        # Pause text
+        pause_text = render_text(self.ui_system.font, "PAUSED", WHITE)
+        text_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        self.screen.blit(pause_text, text_rect)
+        
+        resume_text = render_text(self.ui_system.small_font, "Press ESC to resume", WHITE)
+        resume_rect = resume_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
+        self.screen.blit(resume_text, resume_rect)
+    
+    def draw_statistics(self):
+        """Draw the statistics screen."""
+        self.screen.fill(BLACK)
+        
+        # Title
+        title = render_text(self.ui_system.large_font, "STATISTICS", WHITE)
+        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 100))
+        self.screen.blit(title, title_rect)
+        
+        # Statistics
+        stats = [
+            f"Nights Survived: {self.nights_survived}",
+            f"Total Score: {self.total_score}",
+            f"Total Jumpscares: {self.total_jumpscares}",
+            f"Best Survival Time: {self.best_survival_time} minutes",
+            f"Current Night: {self.simulation.current_night}"
+        ]
+        
+        for i, stat in enumerate(stats):
+            text = render_text(self.ui_system.font, stat, WHITE)
+            text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 170 + i * 40))
+            self.screen.blit(text, text_rect)
+        
+        # Per-night history
+        nights = self.night_history.get_survival_by_night() if self.night_history else []
+        columns = (300, 450, 600, 800)
+        if nights:
+            for x, heading in zip(columns, ("Night", "Played", "Survived", "Best Time")):
+                text = render_text(self.ui_system.small_font, heading, YELLOW)
+                self.screen.blit(text, text.get_rect(center=(x, 400)))
+        for row, summary in enumerate(nights[:7]):
+            best_minutes, best_seconds = divmod(int(summary['best_seconds']), 60)
+            cells = (str(summary['night']), str(summary['played']),
+                     f"{summary['survival_rate']:.0%}", f"{best_minutes}:{best_seconds:02d}")
+            for x, cell in zip(columns, cells):
+                text = render_text(self.ui_system.small_font, cell, WHITE)
+                self.screen.blit(text, text.get_rect(center=(x, 435 + row * 32)))
+        
+        # Return button
+        return_text = render_text(self.ui_system.font, "Press ESC to return", WHITE)
+        return_rect = return_text.get_rect(center=(SCREEN_WIDTH // 2, 720))
+        self.screen.blit(return_text, return_rect)
+        
+        pygame.display.flip()
+    
+    def load_statistics(self):
+        """Load saved statistics from the statistics store."""
+        totals = self.stats_store.totals
+        self.nights_survived = totals['nights_survived']
+        self.total_jumpscares = totals['total_jumpscares']
+        self.best_survival_time = totals['best_survival_time']
+        self.total_score = totals['total_score']
+    
+    def save_statistics(self):
+        """Write out any queued night results and compact the statistics log."""
+        self.commit_night_result()
+        self.stats_store.close()
+        if self.night_history is not None:
+            self.night_history.close()
+    
+    def update(self, dt):
+        """Update game state."""
+        if self.game_state == GameState.PLAYING:
+            self.previous_power = self.simulation.current_power
+            with self.profiler.phase('update_simulation'):
+                self.update_simulation(dt)
+            with self.profiler.phase('update_visual_effects'):
+                self.update_visual_effects(dt)
+            
+            # Update jumpscare timer
+            if self.jumpscare_active:
+                self.jumpscare_timer -= dt
+                if self.jumpscare_timer <= 0:
+                    self.jumpscare_active = False
+    
+    def get_display_power(self):
+        """Get power interpolated between the last two simulation steps."""
+        current_power = self.simulation.current_power
+        return self.previous_power + (current_power - self.previous_power) * self.render_alpha
+    
+    def track_screen_changes(self):
+        """Report screen-wide changes that no single system owns to the dirty-region tracker."""
+        if self.game_state != self.drawn_state:
+            self.drawn_state = self.game_state
+            self.dirty_regions.invalidate_all()
+        
+        if self.game_state in (GameState.MENU, GameState.GAME_OVER, GameState.VICTORY):
+            # Animated backgrounds change every frame
+            self.dirty_regions.invalidate_all()
+        elif self.game_state == GameState.PLAYING:
+            # Full-screen effects repaint everything, including the frame they end on
+            effects_active = self.flash_effect or self.screen_shake or self.jumpscare_active
+            if effects_active or self.drawn_effects:
+                self.dirty_regions.invalidate_all()
+            self.drawn_effects = effects_active
+            
+            animatronics = tuple((animatronic.current_location, animatronic.is_being_watched)
+                                 for animatronic in self.simulation.animatronics)
+            if animatronics != self.drawn_animatronics:
+                self.drawn_animatronics = animatronics
+                self.dirty_regions.invalidate_all()
+    
+    def draw(self):
+        """Draw the current game state."""
+        self.track_screen_changes()
+        if self.game_state == GameState.PAUSED and not self.dirty_regions.is_dirty:
+            return  # The paused scene is frozen
+        
+        if self.game_state == GameState.MENU:
+            self.draw_menu()
+        elif self.game_state == GameState.PLAYING:
+            self.draw_scene()
+            with self.profiler.phase('draw_ui'):
+                self.ui_system.draw_ui(
+                    self.screen, self.get_display_power(), MAX_POWER, self.simulation.current_hour, 
+                    self.simulation.current_minute, self.simulation.current_night, self.simulation.left_door_closed, 
+                    self.simulation.right_door_closed, self.simulation.left_light_on, self.simulation.right_light_on, 
+                    self.simulation.vent_system_active, self.simulation.emergency_power, self.simulation.emergency_power_remaining,
+                    self.camera_system.current_view, self.simulation.animatronics, self.animatronic_ai
+                )
+        elif self.game_state == GameState.GAME_OVER:
+            self.draw_game_over()
+        elif self.game_state == GameState.VICTORY:
+            self.draw_victory()
+        elif self.game_state == GameState.PAUSED:
+            self.draw_paused()
+        
+        self.profiler.draw_overlay(self.screen)
+        with self.profiler.phase('present'):
+            self.dirty_regions.present()
+    
+    def run(self):
+        """Main game loop."""
+        running = True
+        
+        accumulator = 0.0
+        
+        while running:
+            # Clamp long frames so a hitch can't trigger a burst of catch-up steps
+            with tracer.span('wait'):
+                frame_time = min(self.clock.tick(self.render_fps) / 1000.0, MAX_FRAME_TIME)
+            self.profiler.begin_frame()
+            
+            with tracer.span('frame'):
+                with self.profiler.phase('events'):
+                    running = self.handle_events()
+                
+                # Step the simulation at a fixed rate, independent of the render rate
+                accumulator += frame_time
+                while accumulator >= SIMULATION_STEP:
+                    self.update(SIMULATION_STEP)
+                    accumulator -= SIMULATION_STEP
+                self.render_alpha = accumulator / SIMULATION_STEP
+                
+                self.draw()
+            self.profiler.end_frame()
+        
+        if self.profile_csv:
+            self.profiler.dump_csv(self.profile_csv)
+        self.save_statistics()
+        telemetry.stop()
+        tracer.stop()
+        text_cache.clear()
+        animatronic_sprites.clear()
+        clear_fonts()
+        pygame.quit()
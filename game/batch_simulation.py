@@ -0,0 +1,255 @@
+import numpy as np
+from typing import Dict, Optional
+from .constants import *
+from .enums import AnimatronicType, Location, CameraView
+from .animatronic_ai import AnimatronicAI
+from .simulation import create_animatronics
+from .location_graph import (CAMERA_VIEW_INDEX, CAMERA_VIEWS, LOCATION_INDEX, LOCATIONS, OFFICE_INDEX,
+                             VISIBILITY_MASKS)
+
+# Outcome codes stored in BatchNightSimulation.outcome
+RUNNING = 0
+VICTORY = 1
+POWER_OUT = 2
+JUMPSCARE = 3
+
+OUTCOME_NAMES = {RUNNING: None, VICTORY: "victory", POWER_OUT: "power_out", JUMPSCARE: "jumpscare"}
+
+# Next-location table markers
+AT_PATH_END = -1
+OFF_PATH = -2
+
+
+class BatchNightSimulation:
+    """Runs many independent nights in lockstep as NumPy arrays.
+
+    Mirrors `NightSimulation.step` frame for frame, as run with
+    `AnimatronicAI(scheduled=False)`. Each step consumes three arrays of uniform
+    draws in [0, 1): `move_rolls[g, a]` is the movement roll of animatronic a in
+    game g, `cooldown_rolls[g, a]` feeds its cooldown after a move and
+    `jumpscare_rolls[g]` decides a jumpscare. Feeding that scalar path the same
+    draws in its own call order gives the same outcome for every game.
+    """
+
+    def __init__(self, num_games: int, current_night: int = 1,
+                 animatronic_ai: Optional[AnimatronicAI] = None, seed=None):
+        self.animatronic_ai = animatronic_ai or AnimatronicAI()
+        self.num_games = num_games
+        self.current_night = current_night
+        self.rng = np.random.default_rng(seed)
+        self.compile_tables()
+
+        # Office controls
+        self.left_door_closed = np.zeros(num_games, dtype=bool)
+        self.right_door_closed = np.zeros(num_games, dtype=bool)
+        self.left_light_on = np.zeros(num_games, dtype=bool)
+        self.right_light_on = np.zeros(num_games, dtype=bool)
+
+        self.start_night(current_night)
+
+    def compile_tables(self):
+        """Turn the scalar AI's paths, cooldowns, doors and camera coverage into lookup arrays."""
+        ai = self.animatronic_ai
+        template = create_animatronics()
+        num_types = len(template)
+        num_locations = len(LOCATIONS)
+
+        self.animatronic_types = [animatronic.name for animatronic in template]
+        self.jumpscare_chance = np.array([a.jumscare_chance for a in template])
+        self.start_location = np.array([a.location_index for a in template])
+        self.starts_active = np.array([a.is_active for a in template])
+        self.golden_freddy = np.array([a.name == AnimatronicType.GOLDEN_FREDDY for a in template])
+
+        # Next and previous hop per (animatronic, location)
+        self.next_location = np.full((num_types, num_locations), OFF_PATH, dtype=np.int64)
+        self.previous_location = np.zeros((num_types, num_locations), dtype=np.int64)
+        self.path_start = np.zeros(num_types, dtype=np.int64)
+        for column, animatronic in enumerate(template):
+            path = [LOCATION_INDEX[location] for location in ai.movement_paths.get(animatronic.name, [])]
+            if not path:
+                continue
+            self.path_start[column] = path[0]
+            for index, location in enumerate(path):
+                if self.next_location[column, location] != OFF_PATH:
+                    continue  # First occurrence wins, as in the scalar path scan
+                self.next_location[column, location] = path[index + 1] if index + 1 < len(path) else AT_PATH_END
+                self.previous_location[column, location] = path[index - 1] if index > 0 else path[0]
+
+        # Which door stops each animatronic from entering the office
+        self.blocked_by_left_door = np.array([
+            not ai.can_move_to_location(a, Location.OFFICE, True, False) for a in template])
+        self.blocked_by_right_door = np.array([
+            not ai.can_move_to_location(a, Location.OFFICE, False, True) for a in template])
+
+        ranges = [ai.get_movement_cooldown_range(location) for location in LOCATIONS]
+        self.cooldown_low = np.array([low for low, _ in ranges])
+        self.cooldown_span = np.array([high - low for low, high in ranges])
+
+        # visible[camera_view, location]: an animatronic there is watched from that view
+        masks = np.array(VISIBILITY_MASKS, dtype=np.int64)
+        self.visible = (masks[:, None] >> np.arange(num_locations)) & 1 == 1
+
+    def start_night(self, night: int):
+        """Reset every game to the start of the given night."""
+        n = self.num_games
+        num_types = len(self.animatronic_types)
+        self.current_night = night
+        self.movement_chance = self.animatronic_ai.get_movement_chance(night)
+
+        # The clock is shared because every game advances in lockstep
+        self.current_time = 0.0
+        self.last_time_update = 0.0
+        self.current_hour = 12
+        self.current_minute = 0
+
+        self.current_power = np.full(n, float(MAX_POWER))
+        self.vent_system_active = np.zeros(n, dtype=bool)
+        self.emergency_power = np.zeros(n, dtype=bool)
+        self.emergency_power_remaining = np.full(n, float(EMERGENCY_POWER_DURATION))
+        self.camera_view = np.full(n, CAMERA_VIEW_INDEX[CameraView.OFFICE], dtype=np.int64)
+
+        self.location = np.tile(self.start_location, (n, 1))
+        active = np.where(self.golden_freddy, night >= 3, self.starts_active)
+        self.is_active = np.tile(active, (n, 1))
+        self.last_move_time = np.zeros((n, num_types))
+        self.move_cooldown = np.zeros((n, num_types))
+        self.is_being_watched = np.zeros((n, num_types), dtype=bool)
+        self.watching_timer = np.zeros((n, num_types))
+
+        self.outcome = np.full(n, RUNNING, dtype=np.int8)
+        self.end_time = np.zeros(n)
+        self.end_hour = np.zeros(n, dtype=np.int64)
+        self.end_minute = np.zeros(n, dtype=np.int64)
+        self.jumpscare_cause = np.full(n, -1, dtype=np.int64)
+
+    @property
+    def running(self) -> np.ndarray:
+        return self.outcome == RUNNING
+
+    def get_power_drain_rate(self) -> np.ndarray:
+        """Get each game's power drain in percent per second."""
+        return (POWER_DRAIN_RATE
+                + DOOR_POWER_COST * (self.left_door_closed.astype(float) + self.right_door_closed)
+                + LIGHT_POWER_COST * (self.left_light_on.astype(float) + self.right_light_on)
+                + VENT_POWER_COST * self.vent_system_active)
+
+    def finish(self, games: np.ndarray, outcome: int):
+        """Record the outcome and end time for the selected games."""
+        self.outcome[games] = outcome
+        self.end_time[games] = self.current_time
+        self.end_hour[games] = self.current_hour
+        self.end_minute[games] = self.current_minute
+
+    def step(self, dt: float, move_rolls: Optional[np.ndarray] = None,
+             cooldown_rolls: Optional[np.ndarray] = None,
+             jumpscare_rolls: Optional[np.ndarray] = None):
+        """Advance every running game by dt seconds."""
+        shape = self.location.shape
+        if move_rolls is None:
+            move_rolls = self.rng.random(shape)
+        if cooldown_rolls is None:
+            cooldown_rolls = self.rng.random(shape)
+        if jumpscare_rolls is None:
+            jumpscare_rolls = self.rng.random(self.num_games)
+
+        self.current_time += dt
+        self.update_time()
+        self.update_power(dt)
+        self.update_animatronics(move_rolls, cooldown_rolls, jumpscare_rolls)
+
+    def update_time(self):
+        """Update the shared in-game clock."""
+        if self.current_time - self.last_time_update >= TIME_PER_HOUR / 60:
+            self.last_time_update = self.current_time
+            self.current_minute += 1
+
+            if self.current_minute >= 60:
+                self.current_minute = 0
+                self.current_hour += 1
+
+                if self.current_hour >= 6:
+                    self.finish(self.running, VICTORY)
+
+    def update_power(self, dt: float):
+        """Drain power, or emergency power while it lasts, for every running game."""
+        running = self.running
+        emergency = running & self.emergency_power
+        self.emergency_power_remaining[emergency] -= dt
+        expired = emergency & (self.emergency_power_remaining <= 0)
+        self.emergency_power[expired] = False
+        self.emergency_power_remaining[expired] = 0
+
+        draining = running & ~emergency
+        self.current_power -= np.where(draining, self.get_power_drain_rate() * dt, 0.0)
+        out = draining & (self.current_power <= 0)
+        self.current_power[out] = 0
+        self.finish(out, POWER_OUT)
+
+    def update_animatronics(self, move_rolls: np.ndarray, cooldown_rolls: np.ndarray,
+                            jumpscare_rolls: np.ndarray):
+        """Vectorized `AnimatronicAI.update_animatronics` plus jumpscare resolution."""
+        now = self.current_time
+        active = self.is_active & self.running[:, None]
+        num_types = self.location.shape[1]
+        columns = np.arange(num_types)
+
+        # Watching status
+        in_view = self.visible[self.camera_view[:, None], self.location]
+        watched_now = active & in_view
+        released = active & ~in_view & (now - self.watching_timer > 3.0)
+        still_watched = (self.is_being_watched | watched_now) & ~released
+        can_move = active & ~still_watched & (now - self.last_move_time >= self.move_cooldown)
+        rolled = can_move & (move_rolls < self.movement_chance)
+
+        # Structured movement
+        next_location = self.next_location[columns, self.location]
+        off_path = rolled & (next_location == OFF_PATH)
+        stepping = rolled & (next_location >= 0)
+        into_office = stepping & (next_location == OFFICE_INDEX)
+        blocked = into_office & (
+            (self.blocked_by_left_door & self.left_door_closed[:, None])
+            | (self.blocked_by_right_door & self.right_door_closed[:, None]))
+        jumpscares = into_office & ~blocked
+
+        # The scalar loop returns at the first jumpscare, skipping later animatronics
+        has_jumpscare = jumpscares.any(axis=1)
+        first_jumpscare = np.where(has_jumpscare, jumpscares.argmax(axis=1), num_types)
+        applied = columns[None, :] <= first_jumpscare[:, None]
+
+        watched_now &= applied
+        released &= applied
+        self.watching_timer = np.where(watched_now, now, self.watching_timer)
+        self.is_being_watched = (self.is_being_watched | watched_now) & ~released
+
+        stepping &= applied
+        new_location = np.where(blocked, self.previous_location[columns, self.location], next_location)
+        self.location = np.where(off_path & applied, self.path_start[None, :], self.location)
+        self.location = np.where(stepping, new_location, self.location)
+        cooldown = (self.cooldown_low[self.location]
+                    + self.cooldown_span[self.location] * cooldown_rolls)
+        self.move_cooldown = np.where(stepping, cooldown, self.move_cooldown)
+
+        # Resolve the jumpscare against the first animatronic in the office
+        if has_jumpscare.any():
+            in_office = self.location == OFFICE_INDEX
+            first_in_office = in_office.argmax(axis=1)
+            scared = has_jumpscare & (jumpscare_rolls < self.jumpscare_chance[first_in_office])
+            self.jumpscare_cause[scared] = first_in_office[scared]
+            self.finish(scared, JUMPSCARE)
+
+    def run(self, dt: float = SIMULATION_STEP) -> Dict[str, np.ndarray]:
+        """Step until every game has finished and return the results."""
+        while self.running.any():
+            self.step(dt)
+        return self.results()
+
+    def results(self) -> Dict[str, np.ndarray]:
+        """Get per-game outcome, end time, remaining power and jumpscare cause."""
+        return {
+            'outcome': self.outcome.copy(),
+            'end_time': self.end_time.copy(),
+            'end_hour': self.end_hour.copy(),
+            'end_minute': self.end_minute.copy(),
+            'power_remaining': self.current_power.copy(),
+            'jumpscare_cause': self.jumpscare_cause.copy(),
+        }
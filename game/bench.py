@@ -0,0 +1,271 @@
+"""Headless rendering benchmarks with regression baselines.
+
+Times the hot render entry points and the AI update in isolation under the
+dummy SDL video driver, then compares each entry's p95 against a saved
+baseline:
+
+    python -m game.bench --save-baseline bench_baseline.json
+    python -m game.bench --baseline bench_baseline.json --threshold 0.2
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import numpy as np
+import pygame
+from .app import FNAFGame
+from .constants import *
+from .enums import CameraView, GameState, Location
+from .night_history import NightHistory
+from .rng import GameRNG
+from .stats_store import StatsStore
+
+# (name, setup run once, optional per-iteration reset kept out of the timing, timed call)
+Benchmark = Tuple[str, Callable, Optional[Callable], Callable]
+
+
+def create_game(seed: int, stats_dir: str):
+    """Create a game in the PLAYING state with a fixed seed, keeping its statistics in stats_dir."""
+    history = NightHistory(':memory:')
+    stats_store = StatsStore(os.path.join(stats_dir, 'stats.json'), history=history)
+    game = FNAFGame(rng=GameRNG(seed), stats_store=stats_store, night_history=history)
+    game.start_new_game()
+    game.game_state = GameState.PLAYING
+    return game
+
+
+def set_office_controls(game, closed: bool):
+    game.simulation.left_door_closed = closed
+    game.simulation.right_door_closed = closed
+    game.simulation.left_light_on = closed
+    game.simulation.right_light_on = closed
+
+
+def move_all_animatronics(game, location: Location, watched: bool = False):
+    for animatronic in game.simulation.animatronics:
+        animatronic.current_location = location
+        animatronic.is_being_watched = watched
+
+
+def reset_state(game):
+    """Put the game back to a quiet office: doors open, no effects, animatronics home."""
+    set_office_controls(game, False)
+    game.simulation.reset_animatronics()
+    game.simulation.vent_system_active = False
+    game.simulation.emergency_power = False
+    game.flash_effect = False
+    game.screen_shake = False
+    game.camera_system.switch_to_office()
+    game.camera_system.camera_static = False
+
+
+def office_benchmarks(game) -> List[Benchmark]:
+    def draw_office():
+        game.draw_office(game.screen)
+
+    def draw_scene():
+        game.draw_scene()
+
+    def doors_closed():
+        reset_state(game)
+        set_office_controls(game, True)
+
+    def flash_and_shake():
+        reset_state(game)
+        game.flash_effect = True
+        game.screen_shake = True
+
+    def all_in_office():
+        reset_state(game)
+        move_all_animatronics(game, Location.OFFICE)
+
+    return [
+        ('draw_office[idle]', lambda: reset_state(game), None, draw_office),
+        ('draw_office[doors_and_lights]', doors_closed, None, draw_office),
+        ('draw_office[all_animatronics]', all_in_office, None, draw_office),
+        ('draw_scene[office_flash_shake]', flash_and_shake, None, draw_scene),
+    ]
+
+
+def camera_benchmarks(game) -> List[Benchmark]:
+    benchmarks = []
+    for camera_view in CameraView:
+        if camera_view == CameraView.OFFICE:
+            continue
+
+        def setup(camera_view=camera_view):
+            reset_state(game)
+            game.camera_system.switch_to_camera(camera_view)
+            game.camera_system.camera_static = False
+            move_all_animatronics(game, Location(camera_view.value), watched=True)
+
+        def draw_camera_view():
+            game.camera_system.draw_camera_view(game.screen, game.simulation.animatronics)
+
+        benchmarks.append((f"draw_camera_view[{camera_view.name.lower()}]", setup, None, draw_camera_view))
+
+    def static_setup():
+        reset_state(game)
+        game.camera_system.switch_to_camera(CameraView.STAGE)
+
+    def keep_static():
+        game.camera_system.camera_static = True
+
+    benchmarks.append(('draw_scene[camera_static]', static_setup, keep_static, lambda: game.draw_scene()))
+    return benchmarks
+
+
+def map_and_ui_benchmarks(game) -> List[Benchmark]:
+    def draw_small_camera_map():
+        game.camera_system.draw_small_camera_map(game.screen)
+
+    def rebuild_small_camera_map():
+        game.camera_system.small_map_surface = None
+
+    def draw_ui():
+        simulation = game.simulation
+        game.ui_system.draw_ui(
+            game.screen, simulation.current_power, MAX_POWER, simulation.current_hour,
+            simulation.current_minute, simulation.current_night, simulation.left_door_closed,
+            simulation.right_door_closed, simulation.left_light_on, simulation.right_light_on,
+            simulation.vent_system_active, simulation.emergency_power, simulation.emergency_power_remaining,
+            game.camera_system.current_view, simulation.animatronics, game.animatronic_ai)
+
+    def ui_busy():
+        reset_state(game)
+        set_office_controls(game, True)
+        game.simulation.vent_system_active = True
+        game.simulation.emergency_power = True
+        move_all_animatronics(game, Location.HALLWAY_LEFT, watched=True)
+
+    return [
+        ('draw_small_camera_map[cached]', lambda: reset_state(game), None, draw_small_camera_map),
+        ('draw_small_camera_map[rebuild]', lambda: reset_state(game), rebuild_small_camera_map,
+         draw_small_camera_map),
+        ('draw_ui[idle]', lambda: reset_state(game), None, draw_ui),
+        ('draw_ui[all_controls_on]', ui_busy, None, draw_ui),
+        ('draw_menu', lambda: reset_state(game), None, lambda: game.draw_menu()),
+    ]
+
+
+def ai_benchmarks(game) -> List[Benchmark]:
+    simulation = game.simulation
+
+    def setup():
+        reset_state(game)
+        simulation.start_night(5)
+
+    def advance():
+        # Keep everyone on the board so every call does the full amount of work
+        simulation.clock.advance(SIMULATION_STEP)
+        if any(a.current_location == Location.OFFICE for a in simulation.animatronics):
+            simulation.reset_animatronics()
+
+    def update_animatronics():
+        simulation.animatronic_ai.update_animatronics(
+            simulation.animatronics, simulation.current_time, simulation.current_night,
+            simulation.left_door_closed, simulation.right_door_closed, simulation.camera_view)
+
+    return [('update_animatronics[night_5]', setup, advance, update_animatronics)]
+
+
+def get_benchmarks(game) -> List[Benchmark]:
+    return (office_benchmarks(game) + camera_benchmarks(game)
+            + map_and_ui_benchmarks(game) + ai_benchmarks(game))
+
+
+def time_benchmark(benchmark: Benchmark, iterations: int, warmup: int) -> Dict[str, float]:
+    """Run one benchmark and get its timing percentiles in milliseconds."""
+    _, setup, reset, call = benchmark
+    setup()
+    samples = np.empty(iterations)
+    for index in range(-warmup, iterations):
+        if reset is not None:
+            reset()
+        start = time.perf_counter()
+        call()
+        elapsed = time.perf_counter() - start
+        if index >= 0:
+            samples[index] = elapsed
+    samples *= 1000.0
+    p50, p95, p99 = np.percentile(samples, (50, 95, 99))
+    return {
+        'iterations': iterations,
+        'mean': float(samples.mean()),
+        'p50': float(p50),
+        'p95': float(p95),
+        'p99': float(p99),
+        'max': float(samples.max()),
+    }
+
+
+def run_benchmarks(iterations: int = 2000, warmup: int = 50, seed: int = 0,
+                   only: Optional[List[str]] = None) -> Dict[str, Dict[str, float]]:
+    """Time every benchmark whose name starts with one of `only` (all when None)."""
+    with tempfile.TemporaryDirectory(prefix='fnaf-bench-') as stats_dir:
+        game = create_game(seed, stats_dir)
+        results = {}
+        for benchmark in get_benchmarks(game):
+            name = benchmark[0]
+            if only and not any(name.startswith(prefix) for prefix in only):
+                continue
+            results[name] = time_benchmark(benchmark, iterations, warmup)
+        game.save_statistics()
+    return results
+
+
+def find_regressions(results: Dict, baseline: Dict, threshold: float) -> Dict[str, Dict[str, float]]:
+    """Get the entries whose p95 grew by more than `threshold` (0.2 = 20%) over the baseline."""
+    regressions = {}
+    for name, stats in results.items():
+        reference = baseline.get(name)
+        if reference is None or reference['p95'] <= 0:
+            continue
+        change = stats['p95'] / reference['p95'] - 1.0
+        if change > threshold:
+            regressions[name] = {'baseline_p95': reference['p95'], 'p95': stats['p95'], 'change': change}
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m game.bench',
+                                     description='Headless rendering benchmarks with regression baselines.')
+    parser.add_argument('--iterations', type=int, default=2000, help='timed calls per benchmark')
+    parser.add_argument('--warmup', type=int, default=50, help='untimed calls before timing starts')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the game RNG streams')
+    parser.add_argument('--only', nargs='+', help='run only benchmarks whose names start with these')
+    parser.add_argument('--baseline', help='compare p95 against this baseline JSON')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='allowed p95 growth over the baseline as a fraction (default 0.2 = 20%%)')
+    parser.add_argument('--save-baseline', help='write the results to this path as the new baseline')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.iterations, args.warmup, args.seed, args.only)
+    report = {'results': results}
+
+    regressions = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = find_regressions(results, json.load(f)['results'], args.threshold)
+        report['threshold'] = args.threshold
+        report['regressions'] = regressions
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump({'results': results}, f, indent=2)
+
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    pygame.quit()
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
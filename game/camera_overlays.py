@@ -0,0 +1,70 @@
+import numpy as np
+import pygame
+from typing import Dict, Optional, Tuple
+from .constants import *
+from .rng import GameRNG
+
+
+class CameraOverlays:
+    """Pre-rendered scanline and static-noise layers for the camera feed.
+
+    Both layers are generated once with NumPy and applied with a single blend
+    blit: scanlines multiply the feed (white keeps a pixel, black clears it) and
+    static is added onto it (black keeps a pixel, white saturates it).
+    """
+
+    def __init__(self, rng: Optional[GameRNG] = None, static_frame_count: int = 8):
+        self.rng = rng or GameRNG()
+        self.static_frame_count = static_frame_count
+        self.scanline_surfaces: Dict[Tuple[int, int, int], pygame.Surface] = {}
+        self.static_frames: Dict[int, list] = {}
+        self.static_frame_index = 0
+
+    def get_scanlines(self, width: int, height: int, spacing: int = 4) -> pygame.Surface:
+        """Get the multiply layer with a black line every `spacing` rows."""
+        key = (width, height, spacing)
+        surface = self.scanline_surfaces.get(key)
+        if surface is None:
+            pixels = np.full((width, height, 3), 255, dtype=np.uint8)
+            pixels[:, ::spacing] = 0
+            surface = self.finish_surface(pygame.surfarray.make_surface(pixels))
+            self.scanline_surfaces[key] = surface
+        return surface
+
+    def draw_scanlines(self, screen: pygame.Surface, rect: pygame.Rect, spacing: int = 4):
+        """Darken every `spacing`-th row inside rect."""
+        scanlines = self.get_scanlines(rect.width, rect.height, spacing)
+        screen.blit(scanlines, rect.topleft, special_flags=pygame.BLEND_RGB_MULT)
+
+    def get_static_frames(self, dot_count: int) -> list:
+        """Get the atlas of full-screen static frames with `dot_count` white dots each."""
+        frames = self.static_frames.get(dot_count)
+        if frames is None:
+            noise_rng = np.random.default_rng(self.rng.cosmetic.getrandbits(64))
+            frames = []
+            for _ in range(self.static_frame_count):
+                pixels = np.zeros((SCREEN_WIDTH, SCREEN_HEIGHT, 3), dtype=np.uint8)
+                xs = noise_rng.integers(0, SCREEN_WIDTH + 1, dot_count)
+                ys = noise_rng.integers(0, SCREEN_HEIGHT + 1, dot_count)
+                # Same 2x2 footprint as a radius-1 pygame.draw.circle
+                for dx in (-1, 0):
+                    for dy in (-1, 0):
+                        px = xs + dx
+                        py = ys + dy
+                        inside = (px >= 0) & (px < SCREEN_WIDTH) & (py >= 0) & (py < SCREEN_HEIGHT)
+                        pixels[px[inside], py[inside]] = 255
+                frames.append(self.finish_surface(pygame.surfarray.make_surface(pixels)))
+            self.static_frames[dot_count] = frames
+        return frames
+
+    def draw_static(self, screen: pygame.Surface, dot_count: int):
+        """Add the next static frame from the atlas onto the screen."""
+        frames = self.get_static_frames(dot_count)
+        self.static_frame_index = (self.static_frame_index + 1) % len(frames)
+        screen.blit(frames[self.static_frame_index], (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+
+    def finish_surface(self, surface: pygame.Surface) -> pygame.Surface:
+        """Convert to the display format when a display exists, for fast blits."""
+        if pygame.display.get_surface() is not None:
+            return surface.convert()
+        return surface
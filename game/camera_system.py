@@ -1,63 +1,50 @@
 import pygame
-import random
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 from .constants import *
 from .enums import CameraView, Location
+from .rng import GameRNG
+from .camera_overlays import CameraOverlays
+from .dirty_regions import DirtyRegionTracker
+from .fonts import get_font
+from .text_cache import render_text
+from .sprites import animatronic_sprites
+from .location_graph import CAMERA_LABELS, SMALL_MAP_POSITIONS, is_shown_on_camera
+from .tracing import tracer
 
 class CameraSystem:
-    def __init__(self):
+    def __init__(self, rng: Optional[GameRNG] = None, dirty_regions: Optional[DirtyRegionTracker] = None):
+        self.rng = rng or GameRNG()
+        self.dirty_regions = dirty_regions
+        self.overlays = CameraOverlays(self.rng)
         self.current_view = CameraView.OFFICE
         self.camera_static = False
         self.static_timer = 0
         
-        # Small camera map positions (moved higher to avoid button overlap)
-        self.small_map_positions = {
-            # Starting areas (far from office)
-            CameraView.STAGE: (850, 450, 60, 40),
-            CameraView.BACKSTAGE: (920, 450, 60, 40),
-            CameraView.SUPPLY_CLOSET: (990, 450, 60, 40),
-            
-            # Intermediate areas
-            CameraView.DINING_AREA: (850, 500, 60, 40),
-            CameraView.KITCHEN: (920, 500, 60, 40),
-            CameraView.BATHROOM: (990, 500, 60, 40),
-            CameraView.STORAGE_ROOM: (1060, 500, 60, 40),
-            
-            # Approach areas (closer to office)
-            CameraView.HALLWAY_LEFT: (850, 550, 60, 40),
-            CameraView.HALLWAY_RIGHT: (920, 550, 60, 40),
-            CameraView.VENT_LEFT: (990, 550, 60, 40),
-            CameraView.VENT_RIGHT: (1060, 550, 60, 40),
-            
-            # Office (center)
-            CameraView.OFFICE: (1060, 450, 60, 40),
-        }
+        # Baked small camera map, rebuilt after the view changes
+        self.small_map_origin = (840, 420)
+        self.small_map_surface = None
         
-        # Camera labels for the small map
-        self.camera_labels = {
-            CameraView.STAGE: "1A",
-            CameraView.BACKSTAGE: "1B", 
-            CameraView.SUPPLY_CLOSET: "1C",
-            CameraView.DINING_AREA: "2A",
-            CameraView.KITCHEN: "2B",
-            CameraView.BATHROOM: "2C",
-            CameraView.STORAGE_ROOM: "3A",
-            CameraView.HALLWAY_LEFT: "4A",
-            CameraView.HALLWAY_RIGHT: "4B",
-            CameraView.VENT_LEFT: "5A",
-            CameraView.VENT_RIGHT: "5B",
-            CameraView.OFFICE: "OFF"
-        }
+        # Small camera map positions and labels, from the location graph
+        self.small_map_positions = SMALL_MAP_POSITIONS
+        self.camera_labels = CAMERA_LABELS
     
     def switch_to_office(self):
         """Switch back to office view."""
+        if tracer.enabled:
+            tracer.instant('camera_switch', view=CameraView.OFFICE.value)
         self.current_view = CameraView.OFFICE
+        self.small_map_surface = None
+        self.invalidate_screen()
         self.camera_static = True
         self.static_timer = 0.5
     
     def switch_to_camera(self, camera_view: CameraView):
         """Switch to a specific camera view."""
+        if tracer.enabled:
+            tracer.instant('camera_switch', view=camera_view.value)
         self.current_view = camera_view
+        self.small_map_surface = None
+        self.invalidate_screen()
         self.camera_static = True
         self.static_timer = 0.5
     
@@ -67,49 +54,55 @@ class CameraSystem:
         current_index = views.index(self.current_view)
         next_index = (current_index + 1) % len(views)
         self.current_view = views[next_index]
+        if tracer.enabled:
+            tracer.instant('camera_switch', view=self.current_view.value)
+        self.small_map_surface = None
+        self.invalidate_screen()
         self.camera_static = True
         self.static_timer = 0.3
     
+    def invalidate_screen(self):
+        """Report a full repaint to the dirty-region tracker, if there is one."""
+        if self.dirty_regions is not None:
+            self.dirty_regions.invalidate_all()
+    
     def update_static(self, dt: float):
         """Update camera static effect."""
         if self.camera_static:
             self.static_timer -= dt
             if self.static_timer <= 0:
                 self.camera_static = False
+                self.invalidate_screen()
     
     def draw_camera_view(self, screen, animatronics):
         """Draw the classic FNAF camera view with small map."""
         # Fill screen with black
         screen.fill(BLACK)
         
-        # Camera static effect
+        # Camera static is blended over the whole frame by the post-processor
         if self.camera_static:
-            for _ in range(100):
-                x = random.randint(0, SCREEN_WIDTH)
-                y = random.randint(0, SCREEN_HEIGHT)
-                pygame.draw.circle(screen, WHITE, (x, y), 1)
+            self.invalidate_screen()
         
         # Main camera view area (most of screen)
         camera_rect = pygame.Rect(50, 50, SCREEN_WIDTH - 200, SCREEN_HEIGHT - 200)
         pygame.draw.rect(screen, DARK_GRAY, camera_rect)
         
         # Scan lines effect
-        for y in range(50, SCREEN_HEIGHT - 150, 4):
-            pygame.draw.line(screen, (0, 0, 0, 50), (50, y), (SCREEN_WIDTH - 200, y), 1)
+        self.overlays.draw_scanlines(screen, pygame.Rect(50, 50, SCREEN_WIDTH - 249, SCREEN_HEIGHT - 200))
         
         # Show animatronics in current camera view
         for animatronic in animatronics:
-            if animatronic.current_location.value == self.current_view.value:
+            if is_shown_on_camera(self.current_view, animatronic.current_location):
                 self.draw_animatronic_in_camera(screen, animatronic, camera_rect)
         
         # Camera label (top right)
-        font = pygame.font.Font(None, 36)
-        label = font.render(f"Camera: {self.current_view.value}", True, WHITE)
+        font = get_font(36)
+        label = render_text(font, f"Camera: {self.current_view.value}", WHITE)
         screen.blit(label, (SCREEN_WIDTH - 250, 20))
         
         # Time display (top right)
-        time_font = pygame.font.Font(None, 24)
-        time_text = time_font.render("LIVE", True, RED)
+        time_font = get_font(24)
+        time_text = render_text(time_font, "LIVE", RED)
         screen.blit(time_text, (SCREEN_WIDTH - 100, 20))
         
         # Draw small camera map (moved higher)
@@ -117,13 +110,26 @@ class CameraSystem:
     
     def draw_small_camera_map(self, screen):
         """Draw the small camera map (no animatronic locations shown)."""
+        if self.small_map_surface is None:
+            self.small_map_surface = self.render_small_camera_map()
+        screen.blit(self.small_map_surface, self.small_map_origin)
+    
+    def render_small_camera_map(self) -> pygame.Surface:
+        """Bake the small camera map, including the current view highlight, into a surface."""
+        origin_x, origin_y = self.small_map_origin
+        surface = pygame.Surface((290, 180), pygame.SRCALPHA)
+        
         # Map background
-        map_rect = pygame.Rect(840, 440, 290, 160)
-        pygame.draw.rect(screen, DARK_GRAY, map_rect)
-        pygame.draw.rect(screen, WHITE, map_rect, 2)
+        map_rect = pygame.Rect(840 - origin_x, 440 - origin_y, 290, 160)
+        pygame.draw.rect(surface, DARK_GRAY, map_rect)
+        pygame.draw.rect(surface, WHITE, map_rect, 2)
         
         # Draw camera areas
+        small_font = get_font(16)
         for camera_view, (x, y, w, h) in self.small_map_positions.items():
+            x -= origin_x
+            y -= origin_y
+            
             # Determine color based on distance from office
             if camera_view == CameraView.OFFICE:
                 color = GREEN  # Office
@@ -135,69 +141,36 @@ class CameraSystem:
                 color = BLUE  # Starting areas
             
             # Camera area background
-            pygame.draw.rect(screen, BLACK, (x, y, w, h))
-            pygame.draw.rect(screen, color, (x, y, w, h), 2)
+            pygame.draw.rect(surface, BLACK, (x, y, w, h))
+            pygame.draw.rect(surface, color, (x, y, w, h), 2)
             
             # Camera label
-            small_font = pygame.font.Font(None, 16)
             label = self.camera_labels.get(camera_view, "??")
-            label_text = small_font.render(label, True, WHITE)
+            label_text = render_text(small_font, label, WHITE)
             label_rect = label_text.get_rect(center=(x + w // 2, y + h // 2))
-            screen.blit(label_text, label_rect)
+            surface.blit(label_text, label_rect)
             
             # Highlight current view
             if camera_view == self.current_view:
-                pygame.draw.rect(screen, WHITE, (x, y, w, h), 3)
+                pygame.draw.rect(surface, WHITE, (x, y, w, h), 3)
         
         # Map title
-        title_font = pygame.font.Font(None, 20)
-        title = title_font.render("CAMERA MAP", True, WHITE)
-        screen.blit(title, (850, 420))
+        title_font = get_font(20)
+        title = render_text(title_font, "CAMERA MAP", WHITE)
+        surface.blit(title, (850 - origin_x, 420 - origin_y))
+        
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
     
     def draw_animatronic_in_camera(self, screen, animatronic, camera_rect):
         """Draw animatronic in the main camera view."""
-        colors = {
-            "Freddy": BROWN,
-            "Bonnie": BLUE,
-            "Chica": YELLOW,
-            "Foxy": ORANGE,
-            "Golden Freddy": GOLD
-        }
-        
-        color = colors.get(animatronic.name.value, WHITE)
-        
         # Position animatronic in camera view
         animatronic_x = camera_rect.x + camera_rect.width // 2
         animatronic_y = camera_rect.y + camera_rect.height // 2
         
-        # Draw animatronic body
-        animatronic_rect = pygame.Rect(animatronic_x - 50, animatronic_y - 75, 100, 150)
-        pygame.draw.rect(screen, color, animatronic_rect)
-        
-        # Add details based on animatronic type
-        if animatronic.name.value == "Freddy":
-            # Hat
-            hat_rect = pygame.Rect(animatronic_x - 60, animatronic_y - 95, 120, 20)
-            pygame.draw.rect(screen, BROWN, hat_rect)
-            # Bow tie
-            bow_rect = pygame.Rect(animatronic_x - 15, animatronic_y - 35, 30, 15)
-            pygame.draw.rect(screen, RED, bow_rect)
-        
-        # Eyes (glowing effect)
-        eye_color = (255, 0, 0)  # Red eyes in camera view
-        pygame.draw.circle(screen, eye_color, (animatronic_x - 25, animatronic_y - 45), 8)
-        pygame.draw.circle(screen, eye_color, (animatronic_x + 25, animatronic_y - 45), 8)
-        
-        # Name label
-        font = pygame.font.Font(None, 24)
-        name_text = font.render(animatronic.name.value, True, WHITE)
-        screen.blit(name_text, (animatronic_x - 40, animatronic_y - 95))
-        
-        # Watching indicator
-        if animatronic.is_being_watched:
-            pygame.draw.rect(screen, GREEN, animatronic_rect, 3)
-            watch_text = font.render("WATCHED", True, GREEN)
-            screen.blit(watch_text, (animatronic_x - 40, animatronic_y - 115))
+        animatronic_sprites.draw(screen, animatronic.name, 'camera', animatronic.is_being_watched,
+                                 (animatronic_x - 50, animatronic_y - 75))
     
     def handle_small_map_click(self, pos):
         """Handle clicks on the small camera map."""
@@ -0,0 +1,25 @@
+import time
+
+
+class SystemClock:
+    """Wall clock, for timing real frames."""
+
+    def now(self) -> float:
+        return time.perf_counter()
+
+
+class VirtualClock:
+    """Game clock that only moves when advanced, so simulations run as fast as the CPU allows."""
+
+    def __init__(self, start: float = 0.0):
+        self.time = start
+
+    def now(self) -> float:
+        return self.time
+
+    def advance(self, dt: float) -> float:
+        self.time += dt
+        return self.time
+
+    def set(self, time_value: float):
+        self.time = time_value
@@ -1,9 +1,10 @@
-import pygame
-
 # Screen Constants
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
 FPS = 60
+SIMULATION_RATE = 60  # Fixed simulation steps per second, independent of render FPS
+SIMULATION_STEP = 1.0 / SIMULATION_RATE
+MAX_FRAME_TIME = 0.25  # Longest frame fed to the simulation after a hitch
 
 # Colors
 BLACK = (0, 0, 0)
@@ -0,0 +1,58 @@
+import pygame
+from typing import List
+
+
+class DirtyRegionTracker:
+    """Collects the screen areas that changed since the frame was last presented.
+
+    Systems report invalidated rects while drawing; `present` then pushes only
+    those areas to the display instead of flipping the whole window.
+    """
+
+    def __init__(self, width: int, height: int, max_rects: int = 32):
+        self.screen_rect = pygame.Rect(0, 0, width, height)
+        self.max_rects = max_rects
+        self.rects: List[pygame.Rect] = []
+        self.full_redraw = True
+
+    def invalidate(self, rect):
+        """Mark one area of the screen as changed."""
+        if self.full_redraw:
+            return
+        rect = pygame.Rect(rect).clip(self.screen_rect)
+        if rect.width and rect.height:
+            self.rects.append(rect)
+            if len(self.rects) > self.max_rects:
+                self.invalidate_all()
+
+    def invalidate_all(self):
+        """Mark the whole screen as changed."""
+        self.full_redraw = True
+        self.rects.clear()
+
+    @property
+    def is_dirty(self) -> bool:
+        return self.full_redraw or bool(self.rects)
+
+    def get_update_rects(self) -> List[pygame.Rect]:
+        """Get the areas to present, merging overlapping rects."""
+        if self.full_redraw:
+            return [self.screen_rect.copy()]
+
+        merged: List[pygame.Rect] = []
+        for rect in self.rects:
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect = rect.union(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+
+    def present(self):
+        """Push the changed areas to the display and start a new frame."""
+        if self.full_redraw:
+            pygame.display.flip()
+        elif self.rects:
+            pygame.display.update(self.get_update_rects())
+        self.full_redraw = False
+        self.rects.clear()
@@ -0,0 +1,20 @@
+import pygame
+from typing import Dict, Optional, Tuple
+
+# Process-wide fonts keyed by (face, size); loading a font is far too slow for the frame loop
+_fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+
+
+def get_font(size: int, face: Optional[str] = None) -> pygame.font.Font:
+    """Get the shared font for a face and size, loading it on first use."""
+    key = (face, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(face, size)
+        _fonts[key] = font
+    return font
+
+
+def clear_fonts():
+    """Drop all loaded fonts, e.g. before pygame.quit() invalidates them."""
+    _fonts.clear()
@@ -0,0 +1,187 @@
+"""Compiled pizzeria map: the single source of truth for rooms, cameras and paths.
+
+Every `Location` and `CameraView` gets an integer index. What each camera can
+see is a bitmask over location indices and each animatronic's path is a
+position table indexed by location, so the watch check and the next-hop lookup
+are single integer operations.
+"""
+from typing import Dict, List, Tuple
+from .enums import AnimatronicType, Location, CameraView
+
+LOCATIONS = list(Location)
+CAMERA_VIEWS = list(CameraView)
+LOCATION_INDEX = {location: index for index, location in enumerate(LOCATIONS)}
+CAMERA_VIEW_INDEX = {camera_view: index for index, camera_view in enumerate(CAMERA_VIEWS)}
+OFFICE_INDEX = LOCATION_INDEX[Location.OFFICE]
+
+# Structured progression of each animatronic towards the office
+MOVEMENT_PATHS: Dict[AnimatronicType, List[Location]] = {
+    AnimatronicType.FREDDY: [
+        Location.STAGE,
+        Location.DINING_AREA,
+        Location.STORAGE_ROOM,
+        Location.HALLWAY_LEFT,
+        Location.VENT_LEFT,
+        Location.OFFICE
+    ],
+    AnimatronicType.BONNIE: [
+        Location.STAGE,
+        Location.DINING_AREA,
+        Location.KITCHEN,
+        Location.HALLWAY_RIGHT,
+        Location.OFFICE
+    ],
+    AnimatronicType.CHICA: [
+        Location.STAGE,
+        Location.DINING_AREA,
+        Location.KITCHEN,
+        Location.HALLWAY_RIGHT,
+        Location.OFFICE
+    ],
+    AnimatronicType.FOXY: [
+        Location.BACKSTAGE,
+        Location.SUPPLY_CLOSET,
+        Location.STORAGE_ROOM,
+        Location.HALLWAY_LEFT,
+        Location.OFFICE
+    ],
+    AnimatronicType.GOLDEN_FREDDY: [
+        Location.SUPPLY_CLOSET,
+        Location.BATHROOM,
+        Location.STORAGE_ROOM,
+        Location.VENT_RIGHT,
+        Location.OFFICE
+    ]
+}
+
+# Rooms adjacent to each camera, also seen (and frozen) while watching it
+NEARBY_LOCATIONS: Dict[CameraView, List[Location]] = {
+    CameraView.STAGE: [Location.BACKSTAGE, Location.DINING_AREA],
+    CameraView.BACKSTAGE: [Location.STAGE, Location.SUPPLY_CLOSET],
+    CameraView.SUPPLY_CLOSET: [Location.BACKSTAGE, Location.BATHROOM],
+    CameraView.DINING_AREA: [Location.STAGE, Location.KITCHEN, Location.STORAGE_ROOM],
+    CameraView.KITCHEN: [Location.DINING_AREA, Location.HALLWAY_RIGHT],
+    CameraView.BATHROOM: [Location.SUPPLY_CLOSET, Location.STORAGE_ROOM],
+    CameraView.STORAGE_ROOM: [Location.DINING_AREA, Location.BATHROOM, Location.HALLWAY_LEFT, Location.HALLWAY_RIGHT],
+    CameraView.HALLWAY_LEFT: [Location.STORAGE_ROOM, Location.VENT_LEFT, Location.OFFICE],
+    CameraView.HALLWAY_RIGHT: [Location.STORAGE_ROOM, Location.KITCHEN, Location.OFFICE],
+    CameraView.VENT_LEFT: [Location.HALLWAY_LEFT, Location.OFFICE],
+    CameraView.VENT_RIGHT: [Location.OFFICE],
+}
+
+# Screen positions of animatronics drawn outside the camera feed
+OFFICE_POSITION = (400, 200)
+DEFAULT_POSITION = (500, 300)
+ROOM_POSITIONS: Dict[Location, Tuple[int, int]] = {
+    # Starting areas (far from office)
+    Location.STAGE: (200, 300),
+    Location.BACKSTAGE: (400, 300),
+    Location.SUPPLY_CLOSET: (600, 300),
+
+    # Intermediate areas
+    Location.DINING_AREA: (800, 300),
+    Location.KITCHEN: (200, 400),
+    Location.BATHROOM: (400, 400),
+    Location.STORAGE_ROOM: (600, 400),
+
+    # Approach areas (closer to office)
+    Location.HALLWAY_LEFT: (800, 400),
+    Location.HALLWAY_RIGHT: (200, 500),
+    Location.VENT_LEFT: (400, 500),
+    Location.VENT_RIGHT: (600, 500),
+}
+
+# Small camera map buttons as (x, y, width, height)
+SMALL_MAP_POSITIONS: Dict[CameraView, Tuple[int, int, int, int]] = {
+    # Starting areas (far from office)
+    CameraView.STAGE: (850, 450, 60, 40),
+    CameraView.BACKSTAGE: (920, 450, 60, 40),
+    CameraView.SUPPLY_CLOSET: (990, 450, 60, 40),
+
+    # Intermediate areas
+    CameraView.DINING_AREA: (850, 500, 60, 40),
+    CameraView.KITCHEN: (920, 500, 60, 40),
+    CameraView.BATHROOM: (990, 500, 60, 40),
+    CameraView.STORAGE_ROOM: (1060, 500, 60, 40),
+
+    # Approach areas (closer to office)
+    CameraView.HALLWAY_LEFT: (850, 550, 60, 40),
+    CameraView.HALLWAY_RIGHT: (920, 550, 60, 40),
+    CameraView.VENT_LEFT: (990, 550, 60, 40),
+    CameraView.VENT_RIGHT: (1060, 550, 60, 40),
+
+    # Office (center)
+    CameraView.OFFICE: (1060, 450, 60, 40),
+}
+
+CAMERA_LABELS: Dict[CameraView, str] = {
+    CameraView.STAGE: "1A",
+    CameraView.BACKSTAGE: "1B",
+    CameraView.SUPPLY_CLOSET: "1C",
+    CameraView.DINING_AREA: "2A",
+    CameraView.KITCHEN: "2B",
+    CameraView.BATHROOM: "2C",
+    CameraView.STORAGE_ROOM: "3A",
+    CameraView.HALLWAY_LEFT: "4A",
+    CameraView.HALLWAY_RIGHT: "4B",
+    CameraView.VENT_LEFT: "5A",
+    CameraView.VENT_RIGHT: "5B",
+    CameraView.OFFICE: "OFF"
+}
+
+
+def compile_camera_locations() -> List[int]:
+    """Get the index of the room each camera looks into, by camera index."""
+    return [LOCATION_INDEX[Location(camera_view.value)] for camera_view in CAMERA_VIEWS]
+
+
+def compile_visibility_masks() -> List[int]:
+    """Get, per camera index, the bitmask of location indices it watches."""
+    masks = []
+    for camera_view in CAMERA_VIEWS:
+        mask = 0
+        if camera_view != CameraView.OFFICE:  # The office view watches nothing
+            mask |= 1 << CAMERA_LOCATIONS[CAMERA_VIEW_INDEX[camera_view]]
+            for location in NEARBY_LOCATIONS.get(camera_view, []):
+                mask |= 1 << LOCATION_INDEX[location]
+        masks.append(mask)
+    return masks
+
+
+def compile_path_positions() -> Dict[AnimatronicType, List[int]]:
+    """Get each animatronic's first position on its path per location index, or -1 off the path."""
+    tables = {}
+    for animatronic_type, path in MOVEMENT_PATHS.items():
+        table = [-1] * len(LOCATIONS)
+        for position, location in enumerate(path):
+            if table[LOCATION_INDEX[location]] == -1:
+                table[LOCATION_INDEX[location]] = position
+        tables[animatronic_type] = table
+    return tables
+
+
+def compile_room_positions() -> List[Tuple[int, int]]:
+    """Get the screen position of an animatronic per location index."""
+    return [OFFICE_POSITION if location == Location.OFFICE else ROOM_POSITIONS.get(location, DEFAULT_POSITION)
+            for location in LOCATIONS]
+
+
+CAMERA_LOCATIONS = compile_camera_locations()
+VISIBILITY_MASKS = compile_visibility_masks()
+PATH_POSITIONS = compile_path_positions()
+SCREEN_POSITIONS = compile_room_positions()
+
+
+def is_watched_from(camera_view: CameraView, location_index: int) -> bool:
+    """Check whether a camera view sees, and so freezes, an animatronic at a location index."""
+    return (VISIBILITY_MASKS[CAMERA_VIEW_INDEX[camera_view]] >> location_index) & 1 == 1
+
+
+def is_shown_on_camera(camera_view: CameraView, location: Location) -> bool:
+    """Check whether a location is the room a camera view looks into."""
+    return CAMERA_LOCATIONS[CAMERA_VIEW_INDEX[camera_view]] == LOCATION_INDEX[location]
+
+
+def get_screen_position(location: Location) -> Tuple[int, int]:
+    """Get where an animatronic at a location is drawn outside the camera feed."""
+    return SCREEN_POSITIONS[LOCATION_INDEX[location]]
@@ -0,0 +1,195 @@
+"""Per-night history in a local SQLite database.
+
+Every finished night is one row: when it was played, the night number, the
+outcome, how long it lasted, the power left, the animatronic that caused a
+jumpscare and how often each control was used. Per-night survival rates, best
+times and jumpscare causes come from summary tables kept up to date by insert
+triggers, so reports read a handful of rows however many nights are stored.
+Rows from the statistics log are keyed on its sequence number and timestamp,
+so inserting the same logged night again is a no-op.
+
+    python -m game.night_history
+    python -m game.night_history --db fleet.db --night 5
+"""
+import argparse
+import json
+import sqlite3
+import sys
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+HISTORY_PATH = 'fnaf_history.db'
+
+# Control usage columns by replay input name (see `Replay.count_inputs`)
+CONTROL_COLUMNS = {
+    'left_door': 'left_door_uses',
+    'right_door': 'right_door_uses',
+    'left_light': 'left_light_uses',
+    'right_light': 'right_light_uses',
+    'vent': 'vent_uses',
+    'emergency_power': 'emergency_power_uses',
+    'camera': 'camera_switches',
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS nights (
+    id INTEGER PRIMARY KEY,
+    seq INTEGER,
+    timestamp REAL NOT NULL,
+    night INTEGER NOT NULL,
+    outcome TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    power_left REAL NOT NULL,
+    cause TEXT,
+    left_door_uses INTEGER NOT NULL DEFAULT 0,
+    right_door_uses INTEGER NOT NULL DEFAULT 0,
+    left_light_uses INTEGER NOT NULL DEFAULT 0,
+    right_light_uses INTEGER NOT NULL DEFAULT 0,
+    vent_uses INTEGER NOT NULL DEFAULT 0,
+    emergency_power_uses INTEGER NOT NULL DEFAULT 0,
+    camera_switches INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS nights_by_night ON nights (night, outcome, seconds);
+CREATE INDEX IF NOT EXISTS nights_by_outcome ON nights (outcome, cause);
+CREATE INDEX IF NOT EXISTS nights_by_cause ON nights (cause);
+CREATE INDEX IF NOT EXISTS nights_by_timestamp ON nights (timestamp);
+CREATE UNIQUE INDEX IF NOT EXISTS nights_by_seq ON nights (seq, timestamp);
+
+CREATE TABLE IF NOT EXISTS night_summary (
+    night INTEGER PRIMARY KEY,
+    played INTEGER NOT NULL,
+    survived INTEGER NOT NULL,
+    best_seconds REAL NOT NULL,
+    total_seconds REAL NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS nights_summarize AFTER INSERT ON nights
+BEGIN
+    INSERT INTO night_summary (night, played, survived, best_seconds, total_seconds)
+    VALUES (NEW.night, 1, NEW.outcome = 'victory', NEW.seconds, NEW.seconds)
+    ON CONFLICT (night) DO UPDATE SET
+        played = played + 1,
+        survived = survived + excluded.survived,
+        best_seconds = MAX(best_seconds, excluded.best_seconds),
+        total_seconds = total_seconds + excluded.total_seconds;
+END;
+
+CREATE TABLE IF NOT EXISTS jumpscare_summary (
+    night INTEGER NOT NULL,
+    cause TEXT NOT NULL,
+    jumpscares INTEGER NOT NULL,
+    PRIMARY KEY (night, cause)
+);
+CREATE TRIGGER IF NOT EXISTS nights_count_jumpscares AFTER INSERT ON nights
+WHEN NEW.outcome = 'jumpscare'
+BEGIN
+    INSERT INTO jumpscare_summary (night, cause, jumpscares)
+    VALUES (NEW.night, COALESCE(NEW.cause, 'Unknown'), 1)
+    ON CONFLICT (night, cause) DO UPDATE SET jumpscares = jumpscares + 1;
+END;
+"""
+
+# Ignored rows don't fire the summary triggers, so re-inserting a logged night changes nothing
+INSERT = """
+INSERT OR IGNORE INTO nights (seq, timestamp, night, outcome, seconds, power_left, cause, {})
+VALUES (?, ?, ?, ?, ?, ?, ?, {})
+""".format(', '.join(CONTROL_COLUMNS.values()), ', '.join('?' * len(CONTROL_COLUMNS)))
+
+
+def result_row(result: Dict) -> tuple:
+    """Get the insert parameters for a night result as logged by the statistics store."""
+    controls = result.get('controls') or {}
+    return ((result.get('seq'), result.get('timestamp') or time.time(), result['night'], result['outcome'],
+             result.get('seconds', 0.0), result.get('power', 0.0), result.get('cause'))
+            + tuple(controls.get(name, 0) for name in CONTROL_COLUMNS))
+
+
+class NightHistory:
+    """SQLite store of every finished night, safe to share between the game and the stats writer."""
+
+    def __init__(self, path: str = HISTORY_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.connection:
+            if path != ':memory:':
+                self.connection.execute("PRAGMA journal_mode=WAL")
+            columns = [row[1] for row in self.connection.execute("PRAGMA table_info(nights)")]
+            if columns and 'seq' not in columns:
+                self.connection.execute("ALTER TABLE nights ADD COLUMN seq INTEGER")
+            self.connection.executescript(SCHEMA)
+
+    def add(self, result: Dict):
+        self.add_many([result])
+
+    def add_many(self, results: Iterable[Dict]):
+        """Insert night results in one transaction, skipping logged nights already stored."""
+        with self.lock, self.connection:
+            self.connection.executemany(INSERT, (result_row(result) for result in results))
+
+    def get_survival_by_night(self) -> List[Dict]:
+        """Get nights played, survival rate and best and average times per night number."""
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT night, played, survived, best_seconds, total_seconds FROM night_summary ORDER BY night"
+            ).fetchall()
+        return [{
+            'night': night,
+            'played': played,
+            'survived': survived,
+            'survival_rate': survived / played,
+            'best_seconds': best_seconds,
+            'average_seconds': total_seconds / played,
+        } for night, played, survived, best_seconds, total_seconds in rows]
+
+    def get_jumpscare_causes(self, night: Optional[int] = None) -> Dict[str, int]:
+        """Get how many jumpscares each animatronic caused, optionally for one night number."""
+        query = "SELECT cause, SUM(jumpscares) AS total FROM jumpscare_summary"
+        parameters = ()
+        if night is not None:
+            query += " WHERE night = ?"
+            parameters = (night,)
+        with self.lock:
+            rows = self.connection.execute(query + " GROUP BY cause ORDER BY total DESC", parameters).fetchall()
+        return {cause: count for cause, count in rows}
+
+    def get_recent(self, limit: int = 10) -> List[Dict]:
+        """Get the latest nights, newest first."""
+        with self.lock:
+            cursor = self.connection.execute(
+                "SELECT * FROM nights ORDER BY timestamp DESC LIMIT ?", (limit,))
+            columns = [description[0] for description in cursor.description]
+            rows = cursor.fetchall()
+        return [dict(zip(columns, row)) for row in rows]
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m game.night_history',
+                                     description='Report survival rates and best times from the night history.')
+    parser.add_argument('--db', default=HISTORY_PATH, help='history database (default %(default)s)')
+    parser.add_argument('--night', type=int, help='only report jumpscare causes for this night number')
+    parser.add_argument('--recent', type=int, default=0, help='also list this many of the latest nights')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    history = NightHistory(args.db)
+    report = {
+        'nights': history.get_survival_by_night(),
+        'jumpscare_causes': history.get_jumpscare_causes(args.night),
+    }
+    if args.recent:
+        report['recent'] = history.get_recent(args.recent)
+    report['query_ms'] = (time.perf_counter() - start) * 1000.0
+    history.close()
+
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+import pygame
+from typing import Dict, Tuple
+from .constants import *
+
+# Warm tint of the light cones spilling out of the door lights
+LIGHT_CONE_COLOR = (255, 255, 200)
+LIGHT_CONE_ALPHA = 100
+
+# Where each cone sits: (left, top, width), with the lamp on the inner edge
+LIGHT_CONES = {
+    'left': (0, 150, 50),
+    'right': (1100, 150, 100),
+}
+
+
+class OfficeRenderer:
+    """Pre-built office backgrounds, one per door and light combination.
+
+    The office only changes when a door or light is toggled, so each of the
+    16 states is composited once into a converted surface and drawn with a
+    single blit afterwards.
+    """
+
+    def __init__(self):
+        self.layers: Dict[Tuple[bool, bool, bool, bool], pygame.Surface] = {}
+        self.light_cones: Dict[str, pygame.Surface] = {}
+
+    def get_layer(self, left_door_closed: bool, right_door_closed: bool,
+                  left_light_on: bool, right_light_on: bool) -> pygame.Surface:
+        """Get the office background for the given door and light state."""
+        key = (bool(left_door_closed), bool(right_door_closed), bool(left_light_on), bool(right_light_on))
+        layer = self.layers.get(key)
+        if layer is None:
+            layer = self.render_layer(*key)
+            self.layers[key] = layer
+        return layer
+
+    def render_layer(self, left_door_closed: bool, right_door_closed: bool,
+                     left_light_on: bool, right_light_on: bool) -> pygame.Surface:
+        """Composite the office background for one door and light state."""
+        layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        layer.fill(DARK_GRAY)
+
+        # Office background
+        pygame.draw.rect(layer, BLACK, (100, 100, 1000, 500))
+
+        # Doors
+        if left_door_closed:
+            pygame.draw.rect(layer, RED, (100, 100, 200, 500))
+            pygame.draw.circle(layer, YELLOW, (150, 120), 10)
+        else:
+            pygame.draw.rect(layer, GRAY, (100, 100, 200, 500))
+
+        if right_door_closed:
+            pygame.draw.rect(layer, RED, (900, 100, 200, 500))
+            pygame.draw.circle(layer, YELLOW, (1050, 120), 10)
+        else:
+            pygame.draw.rect(layer, GRAY, (900, 100, 200, 500))
+
+        # Lights
+        if left_light_on:
+            pygame.draw.rect(layer, YELLOW, (50, 150, 50, 400))
+            layer.blit(self.get_light_cone('left'), LIGHT_CONES['left'][:2])
+
+        if right_light_on:
+            pygame.draw.rect(layer, YELLOW, (1100, 150, 50, 400))
+            layer.blit(self.get_light_cone('right'), LIGHT_CONES['right'][:2])
+
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        return layer
+
+    def get_light_cone(self, side: str) -> pygame.Surface:
+        """Get the alpha mask of a light cone, fading out away from its lamp."""
+        cone = self.light_cones.get(side)
+        if cone is None:
+            cone = self.render_light_cone(side)
+            self.light_cones[side] = cone
+        return cone
+
+    def render_light_cone(self, side: str) -> pygame.Surface:
+        """Build the trapezoid cone from the 400px lamp to a 300px far edge."""
+        _, _, width = LIGHT_CONES[side]
+        height = 401
+        cone = pygame.Surface((width, height), pygame.SRCALPHA)
+        for distance in range(width):
+            # The cone narrows by 50px at each end over its full width
+            inset = distance * 50 // width
+            alpha = LIGHT_CONE_ALPHA * (width - distance) // width
+            x = width - 1 - distance if side == 'left' else distance
+            pygame.draw.line(cone, (*LIGHT_CONE_COLOR, alpha), (x, inset), (x, height - 1 - inset))
+        return cone
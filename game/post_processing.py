@@ -0,0 +1,57 @@
+import pygame
+from typing import Tuple
+from .constants import *
+from .camera_overlays import CameraOverlays
+
+
+class PostProcessor:
+    """Full-frame effects applied after the scene is drawn.
+
+    The scene is drawn straight to the screen, or into a persistent back
+    buffer while shaking so the whole frame moves with one offset blit.
+    Flash, dim and static are then blended over the frame with reused
+    overlay surfaces, so no surface is allocated per frame.
+    """
+
+    def __init__(self, screen: pygame.Surface, overlays: CameraOverlays,
+                 background: Tuple[int, int, int] = DARK_GRAY):
+        self.screen = screen
+        self.overlays = overlays
+        self.background = background
+        self.back_buffer = self.finish_surface(pygame.Surface(screen.get_size()))
+        self.flash_overlay = self.create_overlay(WHITE, 128)
+        self.dim_overlay = self.create_overlay(BLACK, 128)
+        self.shake_offset = 0
+
+    def create_overlay(self, color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+        """Build a full-screen, single-color translucent overlay."""
+        overlay = pygame.Surface(self.screen.get_size())
+        overlay.fill(color)
+        overlay = self.finish_surface(overlay)
+        overlay.set_alpha(alpha)
+        return overlay
+
+    def begin_frame(self, shake_offset: int = 0) -> pygame.Surface:
+        """Get the surface to draw this frame's scene onto."""
+        self.shake_offset = shake_offset
+        return self.back_buffer if shake_offset else self.screen
+
+    def finish_frame(self, flash: bool = False, dim: bool = False, static_dots: int = 0):
+        """Composite the scene onto the screen and apply the enabled effects."""
+        if self.shake_offset:
+            self.screen.fill(self.background)
+            self.screen.blit(self.back_buffer, (self.shake_offset, 0))
+            self.shake_offset = 0
+
+        if static_dots:
+            self.overlays.draw_static(self.screen, static_dots)
+        if flash:
+            self.screen.blit(self.flash_overlay, (0, 0))
+        if dim:
+            self.screen.blit(self.dim_overlay, (0, 0))
+
+    def finish_surface(self, surface: pygame.Surface) -> pygame.Surface:
+        """Convert to the display format when a display exists, for fast blits."""
+        if pygame.display.get_surface() is not None:
+            return surface.convert()
+        return surface
@@ -0,0 +1,158 @@
+import csv
+import time
+import numpy as np
+import pygame
+from typing import Dict, List, Optional
+from .constants import *
+from .dirty_regions import DirtyRegionTracker
+from .fonts import get_font
+
+# Phases timed every frame by FNAFGame.run, in overlay and CSV column order.
+# The update_time, update_power and update_animatronics steps are timed by
+# NightSimulation.step and are also counted in update_simulation.
+FRAME_PHASES = [
+    'events',
+    'update_simulation',
+    'update_time',
+    'update_power',
+    'update_animatronics',
+    'update_visual_effects',
+    'draw_office',
+    'draw_camera_view',
+    'draw_ui',
+    'present',
+    'total',
+]
+
+PERCENTILES = (50, 95, 99)
+
+
+class PhaseTimer:
+    """Context manager adding the time spent inside it to one profiler column."""
+
+    def __init__(self, profiler: 'FrameProfiler', column: int):
+        self.profiler = profiler
+        self.column = column
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.current[self.column] += time.perf_counter() - self.start
+        return False
+
+
+class FrameProfiler:
+    """Per-phase frame timings kept in a fixed-size ring buffer.
+
+    Each frame is one row of seconds per phase; a phase entered several times
+    in a frame (e.g. catch-up simulation steps) accumulates into the same row.
+    """
+
+    def __init__(self, capacity: int = 600, phases: Optional[List[str]] = None,
+                 dirty_regions: Optional[DirtyRegionTracker] = None, refresh_frames: int = 30):
+        self.phases = list(phases or FRAME_PHASES)
+        self.capacity = capacity
+        self.dirty_regions = dirty_regions
+        self.refresh_frames = refresh_frames
+
+        self.samples = np.zeros((capacity, len(self.phases)))
+        self.current = np.zeros(len(self.phases))
+        self.frame_count = 0
+        self.frame_start = 0.0
+        self.timers: Dict[str, PhaseTimer] = {
+            name: PhaseTimer(self, column) for column, name in enumerate(self.phases)}
+
+        # On-screen overlay
+        self.overlay_visible = False
+        self.overlay_surface: Optional[pygame.Surface] = None
+        self.overlay_rect = pygame.Rect(SCREEN_WIDTH - 340, 60, 320, 24 + 18 * len(self.phases))
+
+    def phase(self, name: str) -> PhaseTimer:
+        """Time a block of the current frame: `with profiler.phase('draw_ui'):`."""
+        return self.timers[name]
+
+    def begin_frame(self):
+        self.current[:] = 0.0
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """Store the current frame in the ring buffer."""
+        if 'total' in self.timers:
+            self.current[self.timers['total'].column] = time.perf_counter() - self.frame_start
+        self.samples[self.frame_count % self.capacity] = self.current
+        self.frame_count += 1
+        if self.overlay_visible and self.frame_count % self.refresh_frames == 0:
+            self.overlay_surface = None
+
+    def get_recent_samples(self) -> np.ndarray:
+        """Get the buffered frames, oldest first, in seconds."""
+        if self.frame_count <= self.capacity:
+            return self.samples[:self.frame_count]
+        start = self.frame_count % self.capacity
+        return np.concatenate((self.samples[start:], self.samples[:start]))
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Get p50/p95/p99 and max per phase over the buffered frames, in milliseconds."""
+        samples = self.get_recent_samples() * 1000.0
+        if not len(samples):
+            return {}
+        percentiles = np.percentile(samples, PERCENTILES, axis=0)
+        peaks = samples.max(axis=0)
+        return {
+            name: {
+                **{f"p{p}": float(percentiles[row, column]) for row, p in enumerate(PERCENTILES)},
+                'max': float(peaks[column]),
+            }
+            for column, name in enumerate(self.phases)
+        }
+
+    def toggle_overlay(self) -> bool:
+        self.overlay_visible = not self.overlay_visible
+        self.overlay_surface = None
+        if self.dirty_regions is not None:
+            self.dirty_regions.invalidate(self.overlay_rect)
+        return self.overlay_visible
+
+    def draw_overlay(self, screen: pygame.Surface):
+        """Draw the percentile table, rebuilding it every `refresh_frames` frames."""
+        if not self.overlay_visible:
+            return
+        if self.overlay_surface is None:
+            self.overlay_surface = self.render_overlay()
+        screen.blit(self.overlay_surface, self.overlay_rect)
+        if self.dirty_regions is not None:
+            self.dirty_regions.invalidate(self.overlay_rect)
+
+    def render_overlay(self) -> pygame.Surface:
+        """Render the stats table; text changes too often to go through the shared text cache."""
+        surface = pygame.Surface(self.overlay_rect.size)
+        surface.fill(BLACK)
+        pygame.draw.rect(surface, GRAY, surface.get_rect(), 1)
+        font = get_font(20)
+
+        stats = self.get_stats()
+        columns = (160, 210, 260)
+        surface.blit(font.render("phase (ms)", True, YELLOW), (8, 6))
+        for x, p in zip(columns, PERCENTILES):
+            surface.blit(font.render(f"p{p}", True, YELLOW), (x, 6))
+        for row, name in enumerate(self.phases):
+            y = 24 + row * 18
+            surface.blit(font.render(name, True, WHITE), (8, y))
+            phase_stats = stats.get(name, {})
+            for x, p in zip(columns, PERCENTILES):
+                value = phase_stats.get(f"p{p}", 0.0)
+                surface.blit(font.render(f"{value:.2f}", True, WHITE), (x, y))
+        return surface
+
+    def dump_csv(self, path: str):
+        """Write the buffered frames as CSV: frame number, then milliseconds per phase."""
+        samples = self.get_recent_samples()
+        first_frame = self.frame_count - len(samples)
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['frame'] + self.phases)
+            for offset, row in enumerate(samples):
+                writer.writerow([first_frame + offset] + [f"{value * 1000.0:.3f}" for value in row])
@@ -0,0 +1,218 @@
+"""Night replays: the state a night started from plus a step-stamped log of player inputs.
+
+A night is deterministic given the simulation state right after it started
+(gameplay RNG, office controls, and the animatronics with whatever cooldowns
+they carried over from the previous night) and the simulation step of every
+input, so that is all a replay stores. Play one back headlessly at full speed,
+or in the game window:
+
+    python -m game.replay night3.fnrp
+    python -m game.replay night3.fnrp --realtime
+"""
+import argparse
+import json
+import struct
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
+from .constants import SIMULATION_STEP
+from .location_graph import CAMERA_VIEWS
+from .rng import GameRNG
+from .simulation import NightSimulation
+from .snapshot import OUTCOMES, SimulationSnapshot
+
+REPLAY_MAGIC = b'FNRP'
+REPLAY_VERSION = 2
+
+# magic, version, night, starting controls, outcome, seed, end step, input count, start state size;
+# followed by the start state (a SimulationSnapshot) and the inputs
+HEADER = struct.Struct('<4sBBBBQIII')
+# step, action, argument
+INPUT = struct.Struct('<IBB')
+
+# Input actions
+LEFT_DOOR = 1
+RIGHT_DOOR = 2
+LEFT_LIGHT = 3
+RIGHT_LIGHT = 4
+VENT = 5
+EMERGENCY_POWER = 6
+CAMERA = 7  # Argument: camera view index
+
+INPUT_NAMES = {
+    LEFT_DOOR: 'left_door',
+    RIGHT_DOOR: 'right_door',
+    LEFT_LIGHT: 'left_light',
+    RIGHT_LIGHT: 'right_light',
+    VENT: 'vent',
+    EMERGENCY_POWER: 'emergency_power',
+    CAMERA: 'camera',
+}
+
+# Bits of the office controls a night started with; doors and lights carry over between nights
+CONTROL_FLAGS = ('left_door_closed', 'right_door_closed', 'left_light_on', 'right_light_on')
+
+
+class Replay:
+    """One recorded night."""
+
+    def __init__(self, seed: int, night: int, controls: int = 0,
+                 start_state: Optional[SimulationSnapshot] = None):
+        self.seed = seed
+        self.night = night
+        self.controls = controls
+        self.start_state = start_state  # Taken right after start_night; None starts from fresh animatronics
+        self.inputs: List[Tuple[int, int, int]] = []
+        self.end_step = 0
+        self.outcome: Optional[str] = None
+
+    def record(self, step: int, action: int, argument: int = 0):
+        self.inputs.append((step, action, argument))
+
+    def finish(self, step: int, outcome: Optional[str]):
+        self.end_step = step
+        self.outcome = outcome
+
+    def count_inputs(self) -> Dict[str, int]:
+        """Get how many times each input was used, by input name."""
+        counts = dict.fromkeys(INPUT_NAMES.values(), 0)
+        for _, action, _ in self.inputs:
+            counts[INPUT_NAMES[action]] += 1
+        return counts
+
+    def to_bytes(self) -> bytes:
+        start_state = self.start_state.to_bytes() if self.start_state is not None else b''
+        header = HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.night, self.controls,
+                             OUTCOMES.index(self.outcome), self.seed, self.end_step, len(self.inputs),
+                             len(start_state))
+        return header + start_state + b''.join(INPUT.pack(*entry) for entry in self.inputs)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Replay':
+        magic, version, night, controls, outcome, seed, end_step, count, start_size = HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError("not a version %d replay" % REPLAY_VERSION)
+        offset = HEADER.size
+        start_state = None
+        if start_size:
+            start_state = SimulationSnapshot.from_bytes(data[offset:offset + start_size])
+            offset += start_size
+        replay = cls(seed, night, controls, start_state)
+        replay.inputs = list(INPUT.iter_unpack(data[offset:offset + count * INPUT.size]))
+        replay.finish(end_step, OUTCOMES[outcome])
+        return replay
+
+    def save(self, path: str):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'Replay':
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+def get_controls(simulation: NightSimulation) -> int:
+    """Pack the simulation's door and light flags into replay control bits."""
+    return sum(1 << bit for bit, flag in enumerate(CONTROL_FLAGS) if getattr(simulation, flag))
+
+
+def set_controls(simulation: NightSimulation, controls: int):
+    for bit, flag in enumerate(CONTROL_FLAGS):
+        setattr(simulation, flag, bool(controls >> bit & 1))
+
+
+def restore_start(simulation: NightSimulation, replay: Replay):
+    """Put a simulation that just started the replay's night into the state the recording started from."""
+    if replay.start_state is not None:
+        simulation.restore(replay.start_state)
+    else:
+        set_controls(simulation, replay.controls)
+
+
+class ReplayPlayer:
+    """Hands out a replay's inputs as the simulation reaches their steps."""
+
+    def __init__(self, replay: Replay):
+        self.replay = replay
+        self.next_input = 0
+
+    @property
+    def finished(self) -> bool:
+        return self.next_input >= len(self.replay.inputs)
+
+    def apply_due(self, step: int, apply: Callable[[int, int], None]):
+        """Call apply(action, argument) for every input recorded before `step` ran."""
+        inputs = self.replay.inputs
+        while self.next_input < len(inputs) and inputs[self.next_input][0] <= step:
+            _, action, argument = inputs[self.next_input]
+            self.next_input += 1
+            apply(action, argument)
+
+
+def apply_to_simulation(simulation: NightSimulation, action: int, argument: int):
+    """Apply one replay input straight to a headless simulation."""
+    if action == LEFT_DOOR:
+        simulation.toggle_left_door()
+    elif action == RIGHT_DOOR:
+        simulation.toggle_right_door()
+    elif action == LEFT_LIGHT:
+        simulation.toggle_left_light()
+    elif action == RIGHT_LIGHT:
+        simulation.toggle_right_light()
+    elif action == VENT:
+        simulation.toggle_vent_system()
+    elif action == EMERGENCY_POWER:
+        simulation.activate_emergency_power()
+    elif action == CAMERA:
+        simulation.camera_view = CAMERA_VIEWS[argument]
+
+
+def play_headless(replay: Replay) -> NightSimulation:
+    """Replay a night as fast as possible and return the finished simulation."""
+    simulation = NightSimulation(replay.night, rng=GameRNG(replay.seed))
+    restore_start(simulation, replay)
+    player = ReplayPlayer(replay)
+
+    def apply(action, argument):
+        apply_to_simulation(simulation, action, argument)
+
+    while simulation.outcome is None:
+        if replay.outcome is None and simulation.step_count >= replay.end_step:
+            break  # The recording stopped before the night ended
+        player.apply_due(simulation.step_count, apply)
+        simulation.step(SIMULATION_STEP)
+    return simulation
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m game.replay', description='Play back a recorded night.')
+    parser.add_argument('path', help='replay file')
+    parser.add_argument('--realtime', action='store_true', help='play in the game window at normal speed')
+    args = parser.parse_args(argv)
+
+    replay = Replay.load(args.path)
+    if args.realtime:
+        from .app import FNAFGame
+        game = FNAFGame()
+        game.play_replay(replay)
+        game.run()
+        return 0
+
+    simulation = play_headless(replay)
+    report = {
+        'night': replay.night,
+        'seed': replay.seed,
+        'inputs': len(replay.inputs),
+        'recorded_outcome': replay.outcome,
+        'recorded_end_step': replay.end_step,
+        'outcome': simulation.outcome,
+        'end_step': simulation.step_count,
+        'matches': simulation.outcome == replay.outcome and simulation.step_count == replay.end_step,
+    }
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0 if report['matches'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
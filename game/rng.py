@@ -0,0 +1,22 @@
+import random
+from typing import Optional, Union
+
+
+class GameRNG:
+    """Seedable random streams shared by every game system.
+
+    Gameplay randomness (movement rolls, cooldowns, jumpscares) and cosmetic
+    randomness (static, shake, particles, warning flicker) come from separate
+    streams, so drawing more or fewer effects never changes a seeded night.
+    """
+
+    def __init__(self, seed: Optional[Union[int, str]] = None):
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 63)
+        self.seed = seed
+        self.gameplay = random.Random(f"{seed}:gameplay")
+        self.cosmetic = random.Random(f"{seed}:cosmetic")
+
+    def reseed_gameplay(self, seed: Union[int, str]):
+        """Restart the gameplay stream as `GameRNG(seed)` would, leaving the cosmetic stream alone."""
+        self.gameplay.seed(f"{seed}:gameplay")
@@ -0,0 +1,220 @@
+"""Monte Carlo balancing runner.
+
+Runs many headless nights of each night number across worker processes and
+prints survival statistics as JSON:
+
+    python -m game.sim --runs 100000 --workers 64 --seed 1
+"""
+import argparse
+import json
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from .enums import AnimatronicType, Location
+from .rng import GameRNG
+from .simulation import NightSimulation
+
+
+def close_doors_on_approach(simulation: NightSimulation):
+    """Keep each door closed while an animatronic it blocks is one step from the office."""
+    ai = simulation.animatronic_ai
+    left_threat = False
+    right_threat = False
+    for animatronic in simulation.animatronics:
+        path = ai.movement_paths.get(animatronic.name, [])
+        if not animatronic.is_active or len(path) < 2 or animatronic.current_location != path[-2]:
+            continue
+        if not ai.can_move_to_location(animatronic, Location.OFFICE, True, False):
+            left_threat = True
+        if not ai.can_move_to_location(animatronic, Location.OFFICE, False, True):
+            right_threat = True
+    simulation.left_door_closed = left_threat
+    simulation.right_door_closed = right_threat
+
+
+POLICIES = {
+    'idle': None,
+    'doors': close_doors_on_approach,
+}
+
+
+def get_elapsed_minutes(simulation: NightSimulation) -> int:
+    """Get in-game minutes since 12 AM."""
+    return (simulation.current_hour - 12) * 60 + simulation.current_minute
+
+
+def run_night(night: int, policy=None, rng: Optional[GameRNG] = None) -> NightSimulation:
+    """Play one night to the end with the given control policy."""
+    simulation = NightSimulation(night, rng=rng)
+    if policy is None:
+        simulation.fast_forward()
+        return simulation
+
+    policy(simulation)
+    while simulation.fast_forward(stop_on_move=True) is None:
+        policy(simulation)
+    return simulation
+
+
+def run_chunk(task: Tuple[int, int, str, str, int]) -> Dict:
+    """Run `runs` nights of one night number on an independently seeded RNG stream."""
+    night, runs, seed, policy_name, bin_minutes = task
+    rng = GameRNG(seed)
+    policy = POLICIES[policy_name]
+
+    survived = 0
+    deaths = Counter()
+    causes = Counter()
+    death_minutes = Counter()
+    power_total = 0.0
+    power_min = None
+    power_max = None
+
+    for _ in range(runs):
+        simulation = run_night(night, policy, rng)
+        if simulation.outcome == "victory":
+            survived += 1
+            power = simulation.current_power
+            power_total += power
+            power_min = power if power_min is None else min(power_min, power)
+            power_max = power if power_max is None else max(power_max, power)
+        else:
+            deaths[simulation.outcome] += 1
+            death_minutes[get_elapsed_minutes(simulation) // bin_minutes * bin_minutes] += 1
+            if simulation.outcome == "jumpscare":
+                causes[simulation.jumpscare_animatronic.name.value] += 1
+
+    return {
+        'night': night,
+        'runs': runs,
+        'survived': survived,
+        'deaths': deaths,
+        'causes': causes,
+        'death_minutes': death_minutes,
+        'power_total': power_total,
+        'power_min': power_min,
+        'power_max': power_max,
+    }
+
+
+def merge_chunks(chunks: List[Dict]) -> Dict:
+    """Combine chunk results for the same night number."""
+    merged = {
+        'runs': 0,
+        'survived': 0,
+        'deaths': Counter(),
+        'causes': Counter(),
+        'death_minutes': Counter(),
+        'power_total': 0.0,
+        'power_min': None,
+        'power_max': None,
+    }
+    for chunk in chunks:
+        merged['runs'] += chunk['runs']
+        merged['survived'] += chunk['survived']
+        merged['deaths'].update(chunk['deaths'])
+        merged['causes'].update(chunk['causes'])
+        merged['death_minutes'].update(chunk['death_minutes'])
+        merged['power_total'] += chunk['power_total']
+        for key, pick in (('power_min', min), ('power_max', max)):
+            if chunk[key] is not None:
+                merged[key] = chunk[key] if merged[key] is None else pick(merged[key], chunk[key])
+    return merged
+
+
+def summarize(merged: Dict, bin_minutes: int) -> Dict:
+    """Turn merged counters into the JSON report for one night number."""
+    runs = merged['runs']
+    survived = merged['survived']
+    return {
+        'runs': runs,
+        'survival_rate': survived / runs if runs else 0.0,
+        'deaths': dict(merged['deaths']),
+        'time_of_death': {
+            f"{start}-{start + bin_minutes}": count
+            for start, count in sorted(merged['death_minutes'].items())
+        },
+        'jumpscares_by_animatronic': {
+            animatronic.value: merged['causes'].get(animatronic.value, 0)
+            for animatronic in AnimatronicType
+        },
+        'power_at_6am': {
+            'mean': merged['power_total'] / survived if survived else None,
+            'min': merged['power_min'],
+            'max': merged['power_max'],
+        },
+    }
+
+
+def build_tasks(nights: List[int], runs: int, chunk_size: int, seed: int,
+                policy_name: str, bin_minutes: int) -> List[Tuple[int, int, str, str, int]]:
+    """Split every night number into chunks, each with its own seed."""
+    tasks = []
+    for night in nights:
+        for chunk_index, start in enumerate(range(0, runs, chunk_size)):
+            count = min(chunk_size, runs - start)
+            tasks.append((night, count, f"{seed}:{night}:{chunk_index}", policy_name, bin_minutes))
+    return tasks
+
+
+def run_balancing(nights: List[int], runs: int, workers: Optional[int] = None, seed: int = 0,
+                  policy_name: str = 'idle', chunk_size: int = 1000, bin_minutes: int = 10) -> Dict:
+    """Run `runs` nights of each night number across a process pool."""
+    tasks = build_tasks(nights, runs, chunk_size, seed, policy_name, bin_minutes)
+    chunks_by_night = {night: [] for night in nights}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in executor.map(run_chunk, tasks):
+            chunks_by_night[chunk['night']].append(chunk)
+
+    return {
+        'seed': seed,
+        'policy': policy_name,
+        'runs_per_night': runs,
+        'nights': {
+            str(night): summarize(merge_chunks(chunks), bin_minutes)
+            for night, chunks in chunks_by_night.items()
+        },
+    }
+
+
+def positive_int(text: str) -> int:
+    """Parse a count that must be at least 1."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError("must be a positive integer, got %s" % text)
+    return value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m game.sim',
+                                     description='Monte Carlo balancing runner for nights 1-5.')
+    parser.add_argument('--runs', type=positive_int, default=10000, help='nights simulated per night number')
+    parser.add_argument('--nights', type=int, nargs='+', choices=range(1, 6), default=[1, 2, 3, 4, 5],
+                        help='night numbers to simulate')
+    parser.add_argument('--workers', type=positive_int, default=os.cpu_count(), help='worker processes')
+    parser.add_argument('--seed', type=int, default=0, help='base seed for the worker RNG streams')
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='idle',
+                        help='player model: idle never touches the controls, doors closes a '
+                             'door while an animatronic waits behind it')
+    parser.add_argument('--chunk-size', type=positive_int, default=1000, help='nights per worker task')
+    parser.add_argument('--bin-minutes', type=positive_int, default=10,
+                        help='width of the time-of-death histogram bins in in-game minutes')
+    parser.add_argument('--output', help='write the JSON report here instead of stdout')
+    args = parser.parse_args(argv)
+
+    report = run_balancing(args.nights, args.runs, args.workers, args.seed, args.policy,
+                           args.chunk_size, args.bin_minutes)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,481 @@
+import math
+from typing import List, Optional
+from .constants import *
+from .enums import AnimatronicType, Location, CameraView
+from .animatronic import Animatronic
+from .animatronic_ai import AnimatronicAI
+from .clock import VirtualClock
+from .rng import GameRNG
+from .location_graph import OFFICE_INDEX
+from .snapshot import CONTROL_FLAGS, SimulationSnapshot
+from . import telemetry as events
+from .telemetry import telemetry
+
+
+def create_animatronics() -> List[Animatronic]:
+    """Create all animatronics with their starting positions and behaviors."""
+    return [
+        Animatronic(
+            name=AnimatronicType.FREDDY,
+            current_location=Location.STAGE,  # Starts far from office
+            target_location=Location.STAGE,
+            movement_speed=0.3,
+            aggression=0.4,
+            jumscare_chance=0.1
+        ),
+        Animatronic(
+            name=AnimatronicType.BONNIE,
+            current_location=Location.STAGE,  # Starts far from office
+            target_location=Location.STAGE,
+            movement_speed=0.5,
+            aggression=0.6,
+            jumscare_chance=0.15
+        ),
+        Animatronic(
+            name=AnimatronicType.CHICA,
+            current_location=Location.STAGE,  # Starts far from office
+            target_location=Location.STAGE,
+            movement_speed=0.4,
+            aggression=0.5,
+            jumscare_chance=0.12
+        ),
+        Animatronic(
+            name=AnimatronicType.FOXY,
+            current_location=Location.BACKSTAGE,  # Starts in backstage, far from office
+            target_location=Location.BACKSTAGE,
+            movement_speed=0.8,
+            aggression=0.7,
+            jumscare_chance=0.2
+        ),
+        Animatronic(
+            name=AnimatronicType.GOLDEN_FREDDY,
+            current_location=Location.SUPPLY_CLOSET,  # Starts in supply closet, far from office
+            target_location=Location.SUPPLY_CLOSET,
+            movement_speed=0.2,
+            aggression=0.9,
+            jumscare_chance=0.3,
+            is_active=False  # Only active on later nights
+        )
+    ]
+
+
+class NightSimulation:
+    """Pure game-state core for a night: clock, power, office controls and animatronics.
+
+    Time is virtual and only advances through `step` or `fast_forward`, so the
+    simulation can run without a display and as fast as the CPU allows.
+    """
+
+    def __init__(self, current_night: int = 1, animatronic_ai: Optional[AnimatronicAI] = None,
+                 rng: Optional[GameRNG] = None, clock: Optional[VirtualClock] = None):
+        self.rng = rng or (animatronic_ai.rng if animatronic_ai else GameRNG())
+        self.clock = clock or VirtualClock()
+        self.animatronic_ai = animatronic_ai or AnimatronicAI(self.rng)
+        self.animatronics = create_animatronics()
+        self.current_night = current_night
+        self.profiler = None  # A FrameProfiler to time each update step under, if any
+
+        # Office controls
+        self.left_door_closed = False
+        self.right_door_closed = False
+        self.left_light_on = False
+        self.right_light_on = False
+
+        self.start_night(current_night)
+
+    def start_night(self, night: int):
+        """Reset the clock, power and animatronics for the given night."""
+        self.current_night = night
+        self.clock.set(0.0)
+        self.step_count = 0
+        self.last_time_update = 0.0
+        self.current_hour = 12  # 12 AM
+        self.current_minute = 0
+        self.current_power = MAX_POWER
+        self.vent_system_active = False
+        self.emergency_power = False
+        self.emergency_power_remaining = EMERGENCY_POWER_DURATION
+        self.camera_view = CameraView.OFFICE
+        self.outcome = None
+        self.jumpscare_animatronic = None
+        self.power_threshold = self.get_next_power_threshold()
+        self.reset_animatronics()
+        if telemetry.enabled:
+            telemetry.emit(events.NIGHT_START, night)
+
+    def reset_animatronics(self):
+        """Reset animatronics to their starting positions."""
+        for animatronic in self.animatronics:
+            if animatronic.name == AnimatronicType.FREDDY:
+                animatronic.current_location = Location.STAGE  # Starting area - far from office
+            elif animatronic.name == AnimatronicType.BONNIE:
+                animatronic.current_location = Location.STAGE  # Starting area - far from office
+            elif animatronic.name == AnimatronicType.CHICA:
+                animatronic.current_location = Location.STAGE  # Starting area - far from office
+            elif animatronic.name == AnimatronicType.FOXY:
+                animatronic.current_location = Location.BACKSTAGE  # Starting area - far from office
+            elif animatronic.name == AnimatronicType.GOLDEN_FREDDY:
+                animatronic.current_location = Location.SUPPLY_CLOSET  # Starting area - far from office
+                animatronic.is_active = self.current_night >= 3
+
+            animatronic.target_location = animatronic.current_location
+            animatronic.last_move_time = self.current_time
+            animatronic.is_being_watched = False
+            animatronic.watching_timer = 0
+            animatronic.last_seen_location = animatronic.current_location
+        self.animatronic_ai.reschedule()
+
+    def snapshot(self) -> SimulationSnapshot:
+        """Capture the night so `restore` can continue it exactly from this moment."""
+        jumpscare_index = -1
+        if self.jumpscare_animatronic is not None:
+            jumpscare_index = self.animatronics.index(self.jumpscare_animatronic)
+        return SimulationSnapshot(
+            self.current_night, self.current_hour, self.current_minute, self.step_count,
+            self.current_time, self.last_time_update, self.current_power,
+            self.emergency_power_remaining, tuple(getattr(self, flag) for flag in CONTROL_FLAGS),
+            self.camera_view, self.outcome, jumpscare_index,
+            tuple(animatronic.snapshot() for animatronic in self.animatronics),
+            self.animatronic_ai.save_schedule(self.animatronics), self.rng.gameplay.getstate())
+
+    def restore(self, snapshot: SimulationSnapshot):
+        """Put the night back to a snapshot, reusing the existing animatronic objects."""
+        if len(snapshot.animatronics) != len(self.animatronics):
+            raise ValueError("snapshot has %d animatronics, simulation has %d"
+                             % (len(snapshot.animatronics), len(self.animatronics)))
+        self.current_night = snapshot.night
+        self.current_hour = snapshot.hour
+        self.current_minute = snapshot.minute
+        self.step_count = snapshot.step_count
+        self.clock.set(snapshot.time)
+        self.last_time_update = snapshot.last_time_update
+        self.current_power = snapshot.power
+        self.emergency_power_remaining = snapshot.emergency_power_remaining
+        for flag, value in zip(CONTROL_FLAGS, snapshot.controls):
+            setattr(self, flag, value)
+        self.camera_view = snapshot.camera_view
+        self.outcome = snapshot.outcome
+        for animatronic, state in zip(self.animatronics, snapshot.animatronics):
+            animatronic.restore(state)
+        self.jumpscare_animatronic = (self.animatronics[snapshot.jumpscare_index]
+                                      if snapshot.jumpscare_index >= 0 else None)
+        self.animatronic_ai.restore_schedule(self.animatronics, self.current_night, snapshot.schedule)
+        self.rng.gameplay.setstate(snapshot.rng_state)
+        self.power_threshold = self.get_next_power_threshold()
+
+    @property
+    def current_time(self) -> float:
+        return self.clock.now()
+
+    @property
+    def is_finished(self) -> bool:
+        return self.outcome is not None
+
+    def toggle_left_door(self) -> bool:
+        self.left_door_closed = not self.left_door_closed
+        if telemetry.enabled:
+            telemetry.emit(events.DOOR, 'left', self.left_door_closed)
+        return self.left_door_closed
+
+    def toggle_right_door(self) -> bool:
+        self.right_door_closed = not self.right_door_closed
+        if telemetry.enabled:
+            telemetry.emit(events.DOOR, 'right', self.right_door_closed)
+        return self.right_door_closed
+
+    def toggle_left_light(self) -> bool:
+        self.left_light_on = not self.left_light_on
+        if telemetry.enabled:
+            telemetry.emit(events.LIGHT, 'left', self.left_light_on)
+        return self.left_light_on
+
+    def toggle_right_light(self) -> bool:
+        self.right_light_on = not self.right_light_on
+        if telemetry.enabled:
+            telemetry.emit(events.LIGHT, 'right', self.right_light_on)
+        return self.right_light_on
+
+    def toggle_vent_system(self) -> bool:
+        self.vent_system_active = not self.vent_system_active
+        if telemetry.enabled:
+            telemetry.emit(events.VENT, self.vent_system_active)
+        return self.vent_system_active
+
+    def activate_emergency_power(self) -> bool:
+        """Activate emergency power if it is still available. Returns True if activated."""
+        if not self.emergency_power and self.emergency_power_remaining > 0:
+            self.emergency_power = True
+            self.current_power = min(self.current_power + 20, MAX_POWER)
+            if telemetry.enabled:
+                telemetry.emit(events.EMERGENCY_POWER, self.current_power)
+            return True
+        return False
+
+    def step(self, dt: float) -> Optional[str]:
+        """Advance the night by dt seconds.
+
+        Returns the outcome ("victory", "power_out" or "jumpscare") once the night ends.
+        """
+        if self.outcome is not None:
+            return self.outcome
+        if self.profiler is not None:
+            return self.profiled_step(dt)
+
+        self.clock.advance(dt)
+        self.step_count += 1
+        self.update_time()
+        if self.outcome is None:
+            self.update_power(dt)
+        if self.outcome is None:
+            self.update_animatronics()
+        if self.outcome is not None and telemetry.enabled:
+            self.report_night_end()
+        return self.outcome
+
+    def profiled_step(self, dt: float) -> Optional[str]:
+        """Same as step, with each update timed as its own profiler phase."""
+        profiler = self.profiler
+        self.clock.advance(dt)
+        self.step_count += 1
+        with profiler.phase('update_time'):
+            self.update_time()
+        if self.outcome is None:
+            with profiler.phase('update_power'):
+                self.update_power(dt)
+        if self.outcome is None:
+            with profiler.phase('update_animatronics'):
+                self.update_animatronics()
+        if self.outcome is not None and telemetry.enabled:
+            self.report_night_end()
+        return self.outcome
+
+    def update_time(self):
+        """Update the in-game time."""
+        if self.current_time - self.last_time_update >= TIME_PER_HOUR / 60:  # Update every minute
+            self.last_time_update = self.current_time
+            self.advance_minute()
+
+    def advance_minute(self):
+        """Advance the in-game clock by one minute."""
+        self.current_minute += 1
+
+        if self.current_minute >= 60:
+            self.current_minute = 0
+            self.current_hour += 1
+
+            if self.current_hour >= 6:  # 6 AM - Victory!
+                self.outcome = "victory"
+
+    def get_power_drain_rate(self) -> float:
+        """Get the current power drain in percent per second."""
+        power_drain = POWER_DRAIN_RATE
+
+        # Door power consumption
+        if self.left_door_closed:
+            power_drain += DOOR_POWER_COST
+        if self.right_door_closed:
+            power_drain += DOOR_POWER_COST
+
+        # Light power consumption
+        if self.left_light_on:
+            power_drain += LIGHT_POWER_COST
+        if self.right_light_on:
+            power_drain += LIGHT_POWER_COST
+
+        # Vent system power consumption
+        if self.vent_system_active:
+            power_drain += VENT_POWER_COST
+
+        return power_drain
+
+    def update_power(self, dt: float):
+        """Update power consumption."""
+        if self.emergency_power:
+            self.emergency_power_remaining -= dt
+            if self.emergency_power_remaining <= 0:
+                self.emergency_power = False
+                self.emergency_power_remaining = 0
+        else:
+            self.current_power -= self.get_power_drain_rate() * dt
+
+            if telemetry.enabled and self.current_power <= self.power_threshold:
+                self.report_power_thresholds()
+
+            if self.current_power <= 0:
+                self.current_power = 0
+                self.outcome = "power_out"
+
+    def get_next_power_threshold(self) -> float:
+        """Get the next telemetry power threshold below the current power, or -inf once all are passed."""
+        for fraction in events.POWER_THRESHOLDS:
+            if self.current_power > fraction * MAX_POWER:
+                return fraction * MAX_POWER
+        return -math.inf
+
+    def report_power_thresholds(self):
+        """Emit the telemetry power thresholds the current power has fallen to."""
+        while self.current_power <= self.power_threshold:
+            telemetry.emit(events.POWER_THRESHOLD, self.power_threshold, self.current_power)
+            self.power_threshold = self.get_next_power_threshold()
+
+    def update_animatronics(self):
+        """Update animatronic positions and resolve jumpscares."""
+        result = self.animatronic_ai.update_animatronics(
+            self.animatronics, self.current_time, self.current_night,
+            self.left_door_closed, self.right_door_closed, self.camera_view
+        )
+
+        if result == "jumpscare":
+            self.resolve_jumpscare()
+
+    def resolve_jumpscare(self):
+        """Roll the jumpscare for the animatronic that reached the office."""
+        for animatronic in self.animatronics:
+            if animatronic.location_index == OFFICE_INDEX:
+                if self.rng.gameplay.random() < animatronic.jumscare_chance:
+                    self.jumpscare_animatronic = animatronic
+                    self.outcome = "jumpscare"
+                    if telemetry.enabled:
+                        telemetry.emit(events.JUMPSCARE, animatronic.name, self.current_night)
+                break
+
+    def fast_forward(self, until: Optional[float] = None, stop_on_move: bool = False,
+                     tick: float = SIMULATION_STEP) -> Optional[str]:
+        """Advance the night event by event instead of frame by frame.
+
+        Equivalent in distribution to calling `step(tick)` in a loop with the
+        controls left untouched. Instead of rolling every frame, the frame of each
+        animatronic's next successful movement roll is sampled from the geometric
+        distribution, and the simulation jumps straight to the next minute tick,
+        move, emergency power expiry or power-out.
+
+        Stops at the end of the night, at the first frame past `until` seconds, or
+        after the first frame with a move if `stop_on_move` is set so callers can
+        change the controls. Returns the outcome once the night ends.
+        """
+        if self.outcome is not None:
+            return self.outcome
+
+        start_time = self.current_time
+        start_step = self.step_count
+        movement_chance = self.animatronic_ai.get_movement_chance(self.current_night)
+        self.animatronic_ai.sync_watching_timers(self.animatronics)
+        last_frame = math.inf
+        if until is not None:
+            last_frame = max(1, math.floor((until - start_time) / tick + 1e-9))
+
+        schedule = [self._sample_move_frame(animatronic, start_time, 1, movement_chance, tick)
+                    for animatronic in self.animatronics]
+        frame = 0
+
+        while self.outcome is None and frame < last_frame:
+            minute_frame = max(frame + 1, self._frames_until(
+                self.last_time_update + TIME_PER_HOUR / 60, start_time, tick))
+            event_frame = min(minute_frame, self._power_event_frame(frame, tick),
+                              min(schedule), last_frame)
+
+            self.clock.set(start_time + event_frame * tick)
+            self.step_count = start_step + event_frame
+            frames_elapsed = event_frame - frame
+            frame = event_frame
+
+            if event_frame == minute_frame:
+                self.last_time_update = self.current_time
+                self.advance_minute()
+                if self.outcome is not None:
+                    break
+
+            self._drain_power_frames(frames_elapsed, tick)
+            if self.outcome is not None:
+                break
+
+            moved = False
+            for index, animatronic in enumerate(self.animatronics):
+                if schedule[index] != event_frame:
+                    continue
+                moved = True
+                result = self.animatronic_ai.move_animatronic_structured(
+                    animatronic, self.left_door_closed, self.right_door_closed)
+                schedule[index] = self._sample_move_frame(
+                    animatronic, start_time, event_frame + 1, movement_chance, tick)
+
+                if result == "jumpscare":
+                    self.resolve_jumpscare()
+                    if self.outcome is not None:
+                        break
+                    # The frame loop stops rolling for the rest of the frame after a
+                    # jumpscare, so later rolls this frame are redrawn from the next one
+                    for later in range(index + 1, len(self.animatronics)):
+                        if schedule[later] == event_frame:
+                            schedule[later] = self._sample_move_frame(
+                                self.animatronics[later], start_time, event_frame + 1,
+                                movement_chance, tick)
+                    break
+
+            if moved and stop_on_move:
+                break
+
+        self._sync_watching_status()
+        self.animatronic_ai.reschedule()
+        if self.outcome is not None and telemetry.enabled:
+            self.report_night_end()
+        return self.outcome
+
+    def report_night_end(self):
+        telemetry.emit(events.NIGHT_END, self.outcome, self.current_night, self.current_power)
+
+    def _frames_until(self, target_time: float, start_time: float, tick: float) -> int:
+        """Get the first frame whose time is at or after target_time."""
+        return max(1, math.ceil((target_time - start_time) / tick - 1e-9))
+
+    def _power_event_frame(self, frame: int, tick: float) -> float:
+        """Get the frame at which emergency power expires or the power runs out."""
+        if self.emergency_power:
+            return frame + max(1, math.ceil(self.emergency_power_remaining / tick - 1e-9))
+        drain_per_frame = self.get_power_drain_rate() * tick
+        return frame + max(1, math.ceil(self.current_power / drain_per_frame - 1e-9))
+
+    def _drain_power_frames(self, frames: int, tick: float):
+        """Apply `frames` frames of power drain at once."""
+        if self.emergency_power:
+            self.emergency_power_remaining -= frames * tick
+            if self.emergency_power_remaining <= 1e-9:
+                self.emergency_power = False
+                self.emergency_power_remaining = 0
+        else:
+            self.current_power -= self.get_power_drain_rate() * tick * frames
+            if telemetry.enabled and self.current_power <= self.power_threshold:
+                self.report_power_thresholds()
+            if self.current_power <= 1e-9:
+                self.current_power = 0
+                self.outcome = "power_out"
+
+    def _sample_move_frame(self, animatronic: Animatronic, start_time: float, first_frame: int,
+                           movement_chance: float, tick: float) -> float:
+        """Sample the frame of the animatronic's next successful movement roll."""
+        if not animatronic.is_active:
+            return math.inf
+
+        path = self.animatronic_ai.movement_paths.get(animatronic.name, [])
+        if not path or animatronic.current_location == path[-1]:
+            return math.inf  # Nowhere left to move
+
+        if self.animatronic_ai.is_animatronic_being_watched(animatronic, self.camera_view):
+            return math.inf  # Frozen for as long as the camera stays here
+
+        eligible_frame = max(first_frame, self._frames_until(
+            animatronic.last_move_time + animatronic.move_cooldown, start_time, tick))
+        if animatronic.is_being_watched:
+            # Still frozen from an earlier camera view; released strictly after the delay
+            release_frame = math.floor(
+                (animatronic.watching_timer + WATCHING_STOP_DURATION - start_time) / tick) + 1
+            eligible_frame = max(eligible_frame, release_frame)
+
+        return eligible_frame + self.animatronic_ai.sample_failed_rolls(movement_chance)
+
+    def _sync_watching_status(self):
+        """Bring watching state up to the current time, as the frame loop would."""
+        for animatronic in self.animatronics:
+            if animatronic.is_active:
+                is_watched = self.animatronic_ai.is_animatronic_being_watched(animatronic, self.camera_view)
+                animatronic.update_watching_status(is_watched, self.current_time)
@@ -0,0 +1,135 @@
+"""Snapshots of a night simulation for instant restarts, checkpoints and lookahead branching.
+
+`NightSimulation.snapshot()` captures everything that decides how the night
+plays out: clock, power, office controls, camera view, every animatronic,
+the movement schedule and the gameplay RNG. Restoring one is a handful of
+attribute writes, and the night continues exactly as it would have from the
+moment the snapshot was taken. Snapshots also pack into a fixed-layout binary
+record for keeping checkpoints on disk.
+"""
+import math
+import struct
+from typing import Optional, Tuple
+from .enums import AnimatronicType, CameraView
+from .location_graph import CAMERA_VIEWS, CAMERA_VIEW_INDEX
+
+SNAPSHOT_MAGIC = b'FNSS'
+SNAPSHOT_VERSION = 1
+
+# Night outcomes, in the order binary records number them
+OUTCOMES = [None, "victory", "power_out", "jumpscare"]
+
+ANIMATRONIC_TYPES = list(AnimatronicType)
+ANIMATRONIC_TYPE_INDEX = {animatronic_type: index for index, animatronic_type in enumerate(ANIMATRONIC_TYPES)}
+
+# Office controls, in flag bit order
+CONTROL_FLAGS = ('left_door_closed', 'right_door_closed', 'left_light_on', 'right_light_on',
+                 'vent_system_active', 'emergency_power')
+
+# magic, version, night, hour, minute, step count, clock time, last minute tick, power,
+# emergency power remaining, control flags, camera view, outcome, jumpscare animatronic
+# (-1 for none), animatronic count, schedule saved, scheduled view, last schedule update (NaN for none)
+HEADER = struct.Struct('<4sBBBBIddddBBBbBBBd')
+# Animatronic.__slots__ order, with enum members and locations as indices
+ANIMATRONIC = struct.Struct('<BBBdddBddBdB')
+# schedule entry kind (-1 for none), in view, due time
+SCHEDULE_ENTRY = struct.Struct('<bBd')
+# Mersenne Twister state words and position, then the cached gauss value if any
+RNG_STATE = struct.Struct('<625IBd')
+
+
+class SimulationSnapshot:
+    """Everything needed to put a `NightSimulation` back to one moment of a night."""
+
+    __slots__ = (
+        'night', 'hour', 'minute', 'step_count', 'time', 'last_time_update', 'power',
+        'emergency_power_remaining', 'controls', 'camera_view', 'outcome', 'jumpscare_index',
+        'animatronics', 'schedule', 'rng_state',
+    )
+
+    def __init__(self, night: int, hour: int, minute: int, step_count: int, time: float,
+                 last_time_update: float, power: float, emergency_power_remaining: float,
+                 controls: Tuple[bool, ...], camera_view: CameraView, outcome: Optional[str],
+                 jumpscare_index: int, animatronics: Tuple[Tuple, ...], schedule: Optional[Tuple],
+                 rng_state: Tuple):
+        self.night = night
+        self.hour = hour
+        self.minute = minute
+        self.step_count = step_count
+        self.time = time
+        self.last_time_update = last_time_update
+        self.power = power
+        self.emergency_power_remaining = emergency_power_remaining
+        self.controls = controls
+        self.camera_view = camera_view
+        self.outcome = outcome
+        self.jumpscare_index = jumpscare_index
+        self.animatronics = animatronics  # Animatronic.snapshot() per animatronic
+        self.schedule = schedule  # AnimatronicAI.save_schedule()
+        self.rng_state = rng_state  # random.Random.getstate() of the gameplay stream
+
+    def to_bytes(self) -> bytes:
+        flags = sum(1 << bit for bit, value in enumerate(self.controls) if value)
+        if self.schedule is None:
+            scheduled_view, last_update_time, entries = CameraView.OFFICE, None, ()
+        else:
+            scheduled_view, last_update_time, entries = self.schedule
+        parts = [HEADER.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_VERSION, self.night, self.hour, self.minute, self.step_count,
+            self.time, self.last_time_update, self.power, self.emergency_power_remaining, flags,
+            CAMERA_VIEW_INDEX[self.camera_view], OUTCOMES.index(self.outcome), self.jumpscare_index,
+            len(self.animatronics), self.schedule is not None, CAMERA_VIEW_INDEX[scheduled_view],
+            math.nan if last_update_time is None else last_update_time)]
+
+        for state in self.animatronics:
+            parts.append(ANIMATRONIC.pack(ANIMATRONIC_TYPE_INDEX[state[0]], *state[1:]))
+        for kind, due_time, in_view in entries:
+            parts.append(SCHEDULE_ENTRY.pack(kind, in_view, due_time))
+
+        _, words, gauss_next = self.rng_state
+        parts.append(RNG_STATE.pack(*words, gauss_next is not None, gauss_next or 0.0))
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'SimulationSnapshot':
+        (magic, version, night, hour, minute, step_count, time, last_time_update, power,
+         emergency_power_remaining, flags, camera_view, outcome, jumpscare_index, count,
+         has_schedule, scheduled_view, last_update_time) = HEADER.unpack_from(data)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError("not a version %d snapshot" % SNAPSHOT_VERSION)
+        offset = HEADER.size
+
+        animatronics = []
+        for state in ANIMATRONIC.iter_unpack(data[offset:offset + count * ANIMATRONIC.size]):
+            name_index, location_index, target_index, speed, aggression, jumpscare_chance, \
+                is_active, last_move_time, cooldown, is_watched, watching_timer, last_seen_index = state
+            animatronics.append((ANIMATRONIC_TYPES[name_index], location_index, target_index, speed,
+                                 aggression, jumpscare_chance, bool(is_active), last_move_time,
+                                 cooldown, bool(is_watched), watching_timer, last_seen_index))
+        offset += count * ANIMATRONIC.size
+
+        schedule = None
+        if has_schedule:
+            entries = tuple((kind, due_time, bool(in_view)) for kind, in_view, due_time
+                            in SCHEDULE_ENTRY.iter_unpack(data[offset:offset + count * SCHEDULE_ENTRY.size]))
+            offset += count * SCHEDULE_ENTRY.size
+            schedule = (CAMERA_VIEWS[scheduled_view],
+                        None if math.isnan(last_update_time) else last_update_time, entries)
+
+        rng_values = RNG_STATE.unpack_from(data, offset)
+        gauss_next = rng_values[-1] if rng_values[-2] else None
+        rng_state = (3, rng_values[:-2], gauss_next)
+
+        controls = tuple(bool(flags >> bit & 1) for bit in range(len(CONTROL_FLAGS)))
+        return cls(night, hour, minute, step_count, time, last_time_update, power,
+                   emergency_power_remaining, controls, CAMERA_VIEWS[camera_view], OUTCOMES[outcome],
+                   jumpscare_index, tuple(animatronics), schedule, rng_state)
+
+    def save(self, path: str):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'SimulationSnapshot':
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
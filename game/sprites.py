@@ -0,0 +1,94 @@
+import pygame
+from typing import Dict, Tuple
+from .constants import *
+from .enums import AnimatronicType
+from .fonts import get_font
+
+ANIMATRONIC_COLORS = {
+    AnimatronicType.FREDDY: BROWN,
+    AnimatronicType.BONNIE: BLUE,
+    AnimatronicType.CHICA: YELLOW,
+    AnimatronicType.FOXY: ORANGE,
+    AnimatronicType.GOLDEN_FREDDY: GOLD
+}
+
+# Per view: body size, eye color, name label offset, "WATCHED" font size and offset.
+# Offsets are relative to the top-left corner of the body.
+SPRITE_VIEWS = {
+    'office': ((100, 150), (255, 255, 255), (0, -20), 20, (0, -35)),
+    'hallway': ((80, 120), (255, 0, 0), (0, -20), 20, (0, -35)),
+    'camera': ((100, 150), (255, 0, 0), (10, -20), 24, (10, -40)),
+}
+
+
+class AnimatronicSprites:
+    """Pre-rendered animatronic sprites, one per type, view and watched state.
+
+    Each sprite holds the body, details, eyes, labels and watching indicator,
+    so drawing an animatronic is a single blit.
+    """
+
+    def __init__(self):
+        self.sprites: Dict[Tuple[AnimatronicType, str, bool], Tuple[pygame.Surface, Tuple[int, int]]] = {}
+
+    def get_sprite(self, animatronic_type: AnimatronicType, view: str,
+                   watched: bool) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Get the sprite and its offset from the top-left corner of the body."""
+        key = (animatronic_type, view, bool(watched))
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = self.render_sprite(*key)
+            self.sprites[key] = sprite
+        return sprite
+
+    def draw(self, screen: pygame.Surface, animatronic_type: AnimatronicType, view: str,
+             watched: bool, position: Tuple[int, int]):
+        """Draw an animatronic whose body's top-left corner is at position."""
+        surface, (offset_x, offset_y) = self.get_sprite(animatronic_type, view, watched)
+        screen.blit(surface, (position[0] + offset_x, position[1] + offset_y))
+
+    def render_sprite(self, animatronic_type: AnimatronicType, view: str,
+                      watched: bool) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Draw one sprite from primitives."""
+        body_size, eye_color, name_offset, watched_font_size, watched_offset = SPRITE_VIEWS[view]
+        body = pygame.Rect((0, 0), body_size)
+        name_text = get_font(24).render(animatronic_type.value, True, WHITE)
+        watched_text = get_font(watched_font_size).render("WATCHED", True, GREEN)
+        is_freddy = animatronic_type == AnimatronicType.FREDDY
+
+        hat_rect = pygame.Rect(-10, -20, 120, 20)
+        bow_rect = pygame.Rect(35, 40, 30, 15)
+        eyes = [(25, 30), (75, 30)]
+
+        parts = [body, name_text.get_rect(topleft=name_offset)]
+        parts.extend(pygame.Rect(x - 8, y - 8, 17, 17) for x, y in eyes)
+        if is_freddy:
+            parts.append(hat_rect)
+        if watched:
+            parts.append(watched_text.get_rect(topleft=watched_offset))
+        bounds = parts[0].unionall(parts[1:])
+
+        surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        origin = (-bounds.x, -bounds.y)
+
+        pygame.draw.rect(surface, ANIMATRONIC_COLORS.get(animatronic_type, WHITE), body.move(origin))
+        if is_freddy:
+            pygame.draw.rect(surface, BROWN, hat_rect.move(origin))
+            pygame.draw.rect(surface, RED, bow_rect.move(origin))
+        for x, y in eyes:
+            pygame.draw.circle(surface, eye_color, (x + origin[0], y + origin[1]), 8)
+        if watched:
+            pygame.draw.rect(surface, GREEN, body.move(origin), 3)
+            surface.blit(watched_text, (watched_offset[0] + origin[0], watched_offset[1] + origin[1]))
+        surface.blit(name_text, (name_offset[0] + origin[0], name_offset[1] + origin[1]))
+
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface, (bounds.x, bounds.y)
+
+    def clear(self):
+        self.sprites.clear()
+
+
+# Process-wide sprites shared by the office and camera views
+animatronic_sprites = AnimatronicSprites()
@@ -0,0 +1,216 @@
+"""Crash-safe statistics: an append-only log of night results folded into a snapshot file.
+
+Every finished night is handed to a background writer thread, which appends it
+to the log as one JSON line and fsyncs it, so a power cut loses at most the
+night in flight and the frame loop never waits on the disk. Every
+`compact_every` results, and on close, the totals are written to the snapshot
+with a temp file and an atomic rename, and once the rename itself is on disk
+the log is emptied. Each log line carries a sequence number and the snapshot
+records the last one folded in, so a crash between those two steps never
+counts a night twice. A result whose append fails is retried before the next
+one, and no compaction runs until it is in the log. With a
+`NightHistory` attached, the writer also inserts each result there before
+the log can be compacted, and loading inserts the logged results again; the
+history skips the ones it already has, so a crash never loses a night there.
+"""
+import json
+import os
+import queue
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+from .night_history import NightHistory
+
+STATS_PATH = 'fnaf_stats.json'
+
+DEFAULT_TOTALS = {
+    'nights_survived': 0,
+    'total_jumpscares': 0,
+    'best_survival_time': 0,
+    'total_score': 0,
+}
+
+
+def apply_result(totals: Dict, result: Dict):
+    """Fold one night result into the running totals."""
+    if result['outcome'] == "victory":
+        totals['nights_survived'] += 1
+        totals['total_score'] += result['score']
+        totals['best_survival_time'] = max(totals['best_survival_time'], result['survival_time'])
+    elif result['outcome'] == "jumpscare":
+        totals['total_jumpscares'] += 1
+
+
+def write_atomic(path: str, data: Dict):
+    """Replace a JSON file so readers only ever see the old or the new contents."""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    fsync_directory(path)
+
+
+def fsync_directory(path: str):
+    """Make a rename or new file in path's directory survive a power cut."""
+    if os.name == 'nt':
+        return  # Directories can't be opened for fsync on Windows
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class StatsStore:
+    """Statistics totals backed by a snapshot file and an append-only log."""
+
+    def __init__(self, path: str = STATS_PATH, log_path: Optional[str] = None, compact_every: int = 20,
+                 history: Optional[NightHistory] = None):
+        self.path = path
+        self.log_path = log_path or path + '.log'
+        self.compact_every = compact_every
+        self.history = history
+
+        self.totals = dict(DEFAULT_TOTALS)
+        self.last_seq = 0
+        self.load()
+
+        # Owned by the writer thread once it starts
+        self.writer_totals = dict(self.totals)
+        self.writer_seq = self.last_seq
+        self.pending_compaction = 0
+        self.unlogged: List[Dict] = []  # Results whose append failed, retried before any compaction
+        self.log_torn = False  # A failed append may have left a partial line
+
+        self.queue: queue.Queue = queue.Queue()
+        self.writer: Optional[threading.Thread] = None
+
+    def load(self):
+        """Read the snapshot, then fold in the logged results it doesn't cover yet."""
+        snapshot_seq = 0
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            for key in DEFAULT_TOTALS:
+                self.totals[key] = int(data.get(key, 0))
+            snapshot_seq = int(data.get('log_seq', 0))
+        except (OSError, ValueError, TypeError, AttributeError):
+            pass  # Missing or unreadable snapshot: start from zero and rebuild from the log
+        self.last_seq = snapshot_seq
+
+        results = self.read_log()
+        for result in results:
+            if result['seq'] > snapshot_seq:
+                apply_result(self.totals, result)
+            self.last_seq = max(self.last_seq, result['seq'])
+
+        if self.history is not None and results:
+            try:
+                self.history.add_many(results)  # Back-fill nights a crash kept out of the history
+            except sqlite3.Error:
+                pass
+
+    def read_log(self) -> List[Dict]:
+        """Get the intact results in the log, cutting off a line torn by a crash."""
+        try:
+            with open(self.log_path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return []
+
+        results = []
+        end = data.rfind(b'\n') + 1
+        for line in data[:end].splitlines():
+            try:
+                result = json.loads(line)
+                if isinstance(result, dict) and 'seq' in result and 'outcome' in result:
+                    results.append(result)
+            except ValueError:
+                continue
+        if end < len(data):
+            with open(self.log_path, 'r+b') as f:
+                f.truncate(end)  # So the next append starts on a fresh line
+        return results
+
+    def start(self):
+        if self.writer is None:
+            self.writer = threading.Thread(target=self.write_loop, name='stats-writer', daemon=True)
+            self.writer.start()
+
+    def record(self, result: Dict):
+        """Count a finished night now and queue it for the log; never blocks on the disk."""
+        self.last_seq += 1
+        result = dict(result, seq=self.last_seq)
+        apply_result(self.totals, result)
+        self.start()
+        self.queue.put(result)
+
+    def close(self):
+        """Write out everything queued, compact, and stop the writer."""
+        if self.writer is not None:
+            self.queue.put(None)
+            self.writer.join()
+            self.writer = None
+        else:
+            try:
+                self.compact()
+            except OSError:
+                pass
+
+    def write_loop(self):
+        while True:
+            result = self.queue.get()
+            if result is None:
+                break
+            self.unlogged.append(result)
+            self.append_unlogged()
+            if self.history is not None:
+                try:
+                    self.history.add(result)
+                except sqlite3.Error:
+                    pass
+            # Compacting now would drop a result that is in neither the log nor the snapshot
+            if not self.unlogged and self.pending_compaction >= self.compact_every:
+                try:
+                    self.compact()
+                except OSError:
+                    pass
+        self.append_unlogged()
+        if not self.unlogged:
+            try:
+                self.compact()
+            except OSError:
+                pass
+
+    def append_unlogged(self):
+        """Append the results not in the log yet, oldest first, stopping at the first failure."""
+        while self.unlogged:
+            try:
+                self.append(self.unlogged[0])
+            except OSError:
+                return  # Keep the game running; the totals are still counted in memory
+            self.unlogged.pop(0)
+
+    def append(self, result: Dict):
+        try:
+            with open(self.log_path, 'a') as f:
+                # Start on a fresh line after a failed append; read_log skips the blank or torn one
+                f.write(("\n" if self.log_torn else "") + json.dumps(result) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError:
+            self.log_torn = True
+            raise
+        self.log_torn = False
+        apply_result(self.writer_totals, result)
+        self.writer_seq = result['seq']
+        self.pending_compaction += 1
+
+    def compact(self):
+        """Fold the log into the snapshot file and empty the log."""
+        write_atomic(self.path, dict(self.writer_totals, log_seq=self.writer_seq))
+        with open(self.log_path, 'w'):
+            pass
+        self.pending_compaction = 0
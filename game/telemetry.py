@@ -0,0 +1,171 @@
+"""Gameplay telemetry: structured events in a preallocated ring, drained to gzipped JSONL.
+
+Game code reports events through the shared `telemetry` bus, guarded so that
+nothing but one attribute check runs while it is disabled:
+
+    if telemetry.enabled:
+        telemetry.emit(MOVE, animatronic.name, from_location, to_location)
+
+`emit` only writes a few references into fixed ring slots. A background thread
+converts them to JSON and appends each batch to the file as a complete gzip
+member, so the frame loop never formats or writes anything and a crash loses
+at most the batch in flight. If the writer falls more than a ring behind, the
+oldest events are dropped and counted rather than blocking the game.
+"""
+import atexit
+import gzip
+import json
+import os
+import threading
+import time
+from enum import Enum
+from typing import List, Optional
+
+# Event kinds
+NIGHT_START = 0
+NIGHT_END = 1
+MOVE = 2
+BLOCKED = 3
+WATCH_START = 4
+WATCH_STOP = 5
+DOOR = 6
+LIGHT = 7
+VENT = 8
+EMERGENCY_POWER = 9
+POWER_THRESHOLD = 10
+JUMPSCARE = 11
+
+# Event names and the meaning of their a, b and c fields, by kind
+EVENTS = [
+    ('night_start', ('night',)),
+    ('night_end', ('outcome', 'night', 'power')),
+    ('move', ('animatronic', 'from', 'to')),
+    ('blocked', ('animatronic', 'target', 'retreat')),
+    ('watch_start', ('animatronic', 'location')),
+    ('watch_stop', ('animatronic', 'location')),
+    ('door', ('side', 'closed')),
+    ('light', ('side', 'on')),
+    ('vent', ('active',)),
+    ('emergency_power', ('power',)),
+    ('power_threshold', ('threshold', 'power')),
+    ('jumpscare', ('animatronic', 'night')),
+]
+
+# Power levels reported once per night when crossed, as fractions of MAX_POWER
+POWER_THRESHOLDS = (0.75, 0.5, 0.25, 0.1)
+
+
+def to_json_value(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, float):
+        return round(value, 3)
+    return value
+
+
+class TelemetryBus:
+    """Single-producer ring of gameplay events with a background gzip writer."""
+
+    def __init__(self, capacity: int = 8192, flush_interval: float = 0.5):
+        if capacity & (capacity - 1):
+            raise ValueError("capacity must be a power of two")
+        self.capacity = capacity
+        self.mask = capacity - 1
+        self.flush_interval = flush_interval
+        self.enabled = False
+        self.clock = None  # Anything with now(), for game-time stamps
+
+        # Ring columns, preallocated so emitting allocates nothing
+        self.wall_times: List[float] = [0.0] * capacity
+        self.game_times: List[float] = [0.0] * capacity
+        self.kinds: List[int] = [0] * capacity
+        self.field_a: List = [None] * capacity
+        self.field_b: List = [None] * capacity
+        self.field_c: List = [None] * capacity
+        self.head = 0  # Events emitted; only the game thread writes it
+        self.tail = 0  # Events written out; only the writer thread writes it
+        self.dropped = 0
+
+        self.path: Optional[str] = None
+        self.writer: Optional[threading.Thread] = None
+        self.stop_event = threading.Event()
+
+    def emit(self, kind: int, a=None, b=None, c=None):
+        """Record one event; callers check `enabled` first."""
+        index = self.head & self.mask
+        self.wall_times[index] = time.time()
+        self.game_times[index] = self.clock.now() if self.clock is not None else 0.0
+        self.kinds[index] = kind
+        self.field_a[index] = a
+        self.field_b[index] = b
+        self.field_c[index] = c
+        self.head += 1
+
+    def start(self, path: str, clock=None):
+        """Enable telemetry and start appending events to a gzipped JSONL file."""
+        if self.writer is not None:
+            return
+        self.path = path
+        self.clock = clock
+        self.head = self.tail = self.dropped = 0
+        self.stop_event.clear()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.writer = threading.Thread(target=self.write_loop, name='telemetry-writer', daemon=True)
+        self.writer.start()
+        self.enabled = True
+        atexit.register(self.stop)
+
+    def stop(self):
+        """Disable telemetry and write out everything still in the ring."""
+        self.enabled = False
+        if self.writer is not None:
+            self.stop_event.set()
+            self.writer.join()
+            self.writer = None
+
+    def write_loop(self):
+        with gzip.open(self.path, 'ab') as f:
+            f.write(self.format_line({'event': 'session', 'wall': time.time(), 'pid': os.getpid()}))
+        while not self.stop_event.wait(self.flush_interval):
+            self.write_batch()
+        self.write_batch()
+
+    def write_batch(self):
+        if self.head == self.tail:
+            return
+        with gzip.open(self.path, 'ab') as f:
+            self.drain(f)
+
+    def drain(self, f):
+        """Write the events emitted since the last drain."""
+        head = self.head
+        start = max(self.tail, head - self.capacity)
+        rows = [self.read_event(sequence) for sequence in range(start, head)]
+
+        # Anything the game lapped while we were reading may be torn
+        valid_from = self.head - self.capacity + 1  # emit may be writing slot head - capacity right now
+        lost = max(start, min(valid_from, head)) - self.tail
+        if lost > 0:
+            self.dropped += lost
+            f.write(self.format_line({'event': 'dropped', 'count': lost}))
+        for sequence, row in zip(range(start, head), rows):
+            if sequence >= valid_from:
+                f.write(self.format_line(row))
+        self.tail = head
+
+    def read_event(self, sequence: int) -> dict:
+        index = sequence & self.mask
+        name, fields = EVENTS[self.kinds[index]]
+        event = {'seq': sequence, 'wall': round(self.wall_times[index], 6),
+                 't': round(self.game_times[index], 4), 'event': name}
+        for field, value in zip(fields, (self.field_a[index], self.field_b[index], self.field_c[index])):
+            event[field] = to_json_value(value)
+        return event
+
+    def format_line(self, data: dict) -> bytes:
+        return (json.dumps(data) + "\n").encode()
+
+
+telemetry = TelemetryBus()
@@ -0,0 +1,57 @@
+import pygame
+from collections import OrderedDict
+from typing import Tuple
+
+
+class TextCache:
+    """Bounded LRU cache of rendered text surfaces.
+
+    Surfaces are keyed by (font, text, color, antialias) and shared between
+    callers, so they must be treated as read-only.
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font: pygame.font.Font, text: str, color: Tuple[int, ...],
+               antialias: bool = True) -> pygame.Surface:
+        """Get the rendered surface for the text, rasterizing it only on a miss."""
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self.surfaces),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Process-wide cache used by all UI and screen drawing
+text_cache = TextCache()
+
+
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, ...],
+                antialias: bool = True) -> pygame.Surface:
+    """Render text through the shared cache."""
+    return text_cache.render(font, text, color, antialias)
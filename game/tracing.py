@@ -0,0 +1,123 @@
+"""Chrome trace-event export of frames, for stutter timelines in Perfetto or chrome://tracing.
+
+With FNAF_TRACE set, FNAFGame wraps its per-frame methods (and the simulation,
+camera, UI and display calls beneath them) so each call becomes a span; spans
+nest by time, so every frame shows its events, simulation steps, draw calls
+and flip. Game events such as camera switches, jumpscares and power warnings
+are instant markers on the same timeline:
+
+    if tracer.enabled:
+        tracer.instant('jumpscare', animatronic=animatronic.name.value)
+
+Nothing is wrapped while tracing is off. Recording stops once the span budget
+is used up, and the trace is written when the game exits.
+"""
+import functools
+import json
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_SPAN_BUDGET = 200000
+
+
+class FrameTracer:
+    """Collects complete and instant trace events against a monotonic clock."""
+
+    def __init__(self):
+        self.enabled = False
+        self.path: Optional[str] = None
+        self.span_budget = DEFAULT_SPAN_BUDGET
+        self.events: List[Dict] = []
+        self.spans = 0
+        self.start_time = 0
+        self.wrapped: List[Tuple[object, str, object, bool]] = []  # (target, name, original, was own attribute)
+
+    def start(self, path: str, span_budget: int = DEFAULT_SPAN_BUDGET):
+        self.path = path
+        self.span_budget = span_budget
+        self.events = [
+            {'name': 'process_name', 'ph': 'M', 'pid': os.getpid(), 'args': {'name': 'FNaMK'}},
+            {'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': 0, 'args': {'name': 'frame loop'}},
+        ]
+        self.spans = 0
+        self.start_time = time.perf_counter_ns()
+        self.enabled = True
+
+    def now(self) -> float:
+        """Get microseconds since tracing started."""
+        return (time.perf_counter_ns() - self.start_time) / 1000.0
+
+    def add_span(self, name: str, start: float, end: float, category: str):
+        if self.spans >= self.span_budget:
+            if self.enabled:
+                self.instant('span budget exhausted', spans=self.spans)
+                self.enabled = False
+            return
+        self.spans += 1
+        self.events.append({'name': name, 'cat': category, 'ph': 'X', 'ts': start, 'dur': end - start,
+                            'pid': os.getpid(), 'tid': 0})
+
+    def span(self, name: str, category: str = 'frame') -> 'TraceSpan':
+        """Time a block as one span: `with tracer.span('frame'):`."""
+        return TraceSpan(self, name, category)
+
+    def instant(self, name: str, **args):
+        """Mark a moment on the timeline, e.g. a camera switch."""
+        self.events.append({'name': name, 'cat': 'game', 'ph': 'i', 's': 'g', 'ts': self.now(),
+                            'pid': os.getpid(), 'tid': 0, 'args': args})
+
+    def instrument(self, target, *names: str, prefix: Optional[str] = None):
+        """Replace methods or functions on `target` with versions that record a span per call."""
+        if prefix is None:
+            prefix = getattr(target, '__name__', type(target).__name__)
+        for name in names:
+            original = getattr(target, name)
+            self.wrapped.append((target, name, original, name in vars(target)))
+            setattr(target, name, self.traced(original, f"{prefix}.{name}"))
+
+    def traced(self, function, name: str):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return function(*args, **kwargs)
+            start = self.now()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.add_span(name, start, self.now(), 'call')
+        return wrapper
+
+    def stop(self):
+        """Undo the instrumentation and write the trace file."""
+        self.enabled = False
+        for target, name, original, was_own in reversed(self.wrapped):
+            if was_own:
+                setattr(target, name, original)
+            else:
+                delattr(target, name)  # Uncover the class attribute again
+        self.wrapped.clear()
+        if self.path:
+            with open(self.path, 'w') as f:
+                json.dump({'traceEvents': self.events, 'displayTimeUnit': 'ms'}, f)
+            self.path = None
+
+
+class TraceSpan:
+    def __init__(self, tracer: FrameTracer, name: str, category: str):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = self.tracer.now()
+        return self
+
+    def __exit__(self, *exc):
+        if self.tracer.enabled:
+            self.tracer.add_span(self.name, self.start, self.tracer.now(), self.category)
+        return False
+
+
+tracer = FrameTracer()
@@ -1,12 +1,19 @@
 import pygame
-from typing import Dict
+from typing import Dict, Optional
 from .constants import *
+from .dirty_regions import DirtyRegionTracker
+from .fonts import get_font
+from .text_cache import render_text
 
 class UISystem:
-    def __init__(self):
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
-        self.large_font = pygame.font.Font(None, 48)
+    def __init__(self, dirty_regions: Optional[DirtyRegionTracker] = None):
+        self.dirty_regions = dirty_regions
+        self.drawn_regions = {}
+        self.frame_regions = set()
+        
+        self.font = get_font(36)
+        self.small_font = get_font(24)
+        self.large_font = get_font(48)
         
         # UI buttons
         self.buttons = self.create_ui_buttons()
@@ -30,6 +37,8 @@ class UISystem:
                 right_light_on, vent_system_active, emergency_power, emergency_power_remaining,
                 camera_view, animatronics=None, animatronic_ai=None):
         """Draw the enhanced user interface."""
+        self.frame_regions = set()
+        
         # Power meter with warning colors (top left)
         power_rect = pygame.Rect(50, 50, 200, 30)
         pygame.draw.rect(screen, RED, power_rect)
@@ -44,14 +53,15 @@ class UISystem:
         
         power_fill_rect = pygame.Rect(50, 50, int(200 * power_percentage), 30)
         pygame.draw.rect(screen, power_color, power_fill_rect)
+        self.mark_region('power_bar', (power_fill_rect.width, power_color), power_rect)
         
-        power_text = self.small_font.render(f"Power left: {int(current_power)}%", True, WHITE)
-        screen.blit(power_text, (50, 20))
+        power_text = render_text(self.small_font, f"Power left: {int(current_power)}%", WHITE)
+        self.blit_text(screen, 'power_text', power_text, (50, 20))
         
         # Power usage indicators (bottom left) - classic FNAF style
         usage_y = 650
-        usage_text = self.small_font.render("Usage:", True, WHITE)
-        screen.blit(usage_text, (50, usage_y))
+        usage_text = render_text(self.small_font, "Usage:", WHITE)
+        self.blit_text(screen, 'usage_text', usage_text, (50, usage_y))
         
         # Usage bars
         bar_width = 15
@@ -70,13 +80,16 @@ class UISystem:
         else:
             pygame.draw.rect(screen, GRAY, (50 + bar_width + bar_spacing, usage_y + 20, bar_width, bar_height))
         
+        self.mark_region('usage_bars', (left_door_closed, right_door_closed),
+                         pygame.Rect(50, usage_y + 20, bar_width * 2 + bar_spacing, bar_height))
+        
         # Enhanced time display (top center)
-        time_text = self.large_font.render(f"{current_hour:02d}:{current_minute:02d}", True, WHITE)
-        screen.blit(time_text, (SCREEN_WIDTH // 2 - 80, 20))
+        time_text = render_text(self.large_font, f"{current_hour:02d}:{current_minute:02d}", WHITE)
+        self.blit_text(screen, 'time_text', time_text, (SCREEN_WIDTH // 2 - 80, 20))
         
         # Night display (top right)
-        night_text = self.font.render(f"Night {current_night}", True, WHITE)
-        screen.blit(night_text, (SCREEN_WIDTH - 150, 20))
+        night_text = render_text(self.font, f"Night {current_night}", WHITE)
+        self.blit_text(screen, 'night_text', night_text, (SCREEN_WIDTH - 150, 20))
         
         # Enhanced control buttons
         button_labels = {
@@ -96,11 +109,12 @@ class UISystem:
                                                      right_light_on, vent_system_active, 
                                                      emergency_power) else GRAY
                 pygame.draw.rect(screen, color, button_rect)
+                self.mark_region(button_name, color, button_rect)
                 
                 label = button_labels[button_name]
-                text = self.small_font.render(label, True, WHITE)
+                text = render_text(self.small_font, label, WHITE)
                 text_rect = text.get_rect(center=button_rect.center)
-                screen.blit(text, text_rect)
+                self.blit_text(screen, button_name + '_label', text, text_rect)
         
         # Enhanced status indicators (bottom center)
         status_y = 720
@@ -114,17 +128,17 @@ class UISystem:
         ]
         
         for i, status in enumerate(statuses):
-            text = self.small_font.render(status, True, WHITE)
-            screen.blit(text, (50 + (i % 2) * 300, status_y + (i // 2) * 25))
+            text = render_text(self.small_font, status, WHITE)
+            self.blit_text(screen, f'status_{i}', text, (50 + (i % 2) * 300, status_y + (i // 2) * 25))
         
         # Emergency power indicator
         if emergency_power:
-            emergency_text = self.font.render(f"EMERGENCY POWER: {int(emergency_power_remaining)}s", True, RED)
-            screen.blit(emergency_text, (SCREEN_WIDTH // 2 - 150, 80))
+            emergency_text = render_text(self.font, f"EMERGENCY POWER: {int(emergency_power_remaining)}s", RED)
+            self.blit_text(screen, 'emergency_text', emergency_text, (SCREEN_WIDTH // 2 - 150, 80))
         
         # Camera view indicator
-        view_text = self.small_font.render(f"View: {camera_view.value}", True, WHITE)
-        screen.blit(view_text, (SCREEN_WIDTH - 200, 80))
+        view_text = render_text(self.small_font, f"View: {camera_view.value}", WHITE)
+        self.blit_text(screen, 'view_text', view_text, (SCREEN_WIDTH - 200, 80))
         
         # Animatronic danger level indicator
         if animatronics and animatronic_ai:
@@ -136,8 +150,35 @@ class UISystem:
                         danger_levels.append(f"{animatronic.name.value}: Level {danger_level}")
             
             if danger_levels:
-                danger_text = self.small_font.render("HIGH DANGER: " + ", ".join(danger_levels), True, RED)
-                screen.blit(danger_text, (50, 110))
+                danger_text = render_text(self.small_font, "HIGH DANGER: " + ", ".join(danger_levels), RED)
+                self.blit_text(screen, 'danger_text', danger_text, (50, 110))
+        
+        # Anything drawn last frame but not this one has to be repainted too
+        for key in list(self.drawn_regions):
+            if key not in self.frame_regions:
+                _, rect = self.drawn_regions.pop(key)
+                if self.dirty_regions is not None:
+                    self.dirty_regions.invalidate(rect)
+    
+    def mark_region(self, key, value, rect):
+        """Report rect as dirty when the value drawn there differs from last frame."""
+        rect = pygame.Rect(rect)
+        self.frame_regions.add(key)
+        previous = self.drawn_regions.get(key)
+        if previous is not None and previous[0] == value and previous[1] == rect:
+            return
+        
+        if self.dirty_regions is not None:
+            self.dirty_regions.invalidate(rect)
+            if previous is not None:
+                self.dirty_regions.invalidate(previous[1])
+        self.drawn_regions[key] = (value, rect)
+    
+    def blit_text(self, screen, key, text_surface, dest):
+        """Blit a rendered text surface and track its region for partial updates."""
+        rect = screen.blit(text_surface, dest)
+        # Text surfaces come from the shared cache, so identity tracks the text
+        self.mark_region(key, text_surface, rect)
     
     def is_button_active(self, button_name: str, left_door_closed: bool, right_door_closed: bool,
                         left_light_on: bool, right_light_on: bool, vent_system_active: bool,